@@ -1,3 +1,4 @@
+import functools
 import importlib.resources
 from datetime import datetime
 from typing import TYPE_CHECKING, Literal, Optional
@@ -24,6 +25,17 @@ def _is_anthropic_4_5_model(model_name: str | None) -> bool:
 	return is_opus_4_5 or is_haiku_4_5
 
 
+@functools.cache
+def _read_prompt_template(template_filename: str) -> str:
+	"""Read a packaged system prompt template once per process; every Agent after the first reuses the same string."""
+	# This works both in development and when installed as a package.
+	# utf-8-sig drops a byte-order mark an editor may have saved at the top of the file (it would otherwise
+	# end up as an invisible first character of the system prompt), and read_text() skips the file-object dance
+	return (
+		importlib.resources.files('browser_use.agent.system_prompts').joinpath(template_filename).read_text(encoding='utf-8-sig')
+	)
+
+
 class SystemPrompt:
 	def __init__(
 		self,
@@ -80,13 +92,7 @@ class SystemPrompt:
 			else:
 				template_filename = 'system_prompt_no_thinking.md'
 
-			# This works both in development and when installed as a package
-			with (
-				importlib.resources.files('browser_use.agent.system_prompts')
-				.joinpath(template_filename)
-				.open('r', encoding='utf-8') as f
-			):
-				self.prompt_template = f.read()
+			self.prompt_template = _read_prompt_template(template_filename)
 		except Exception as e:
 			raise RuntimeError(f'Failed to load system prompt template: {e}')
 
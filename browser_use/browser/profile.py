@@ -226,6 +226,23 @@ def get_display_size() -> ViewportSize | None:
 	return None
 
 
+@cache
+def _get_flag_args(docker: bool, headless: bool, disable_security: bool, deterministic_rendering: bool) -> tuple[str, ...]:
+	"""Merge the flag-selected CHROME_*_ARGS groups once per flag combination and share the result across profiles."""
+	# Groups overlap on purpose (e.g. --disable-site-isolation-trials is in both the docker and disable-security
+	# groups, since either may be selected alone); drop the repeats once here rather than in every get_args() call
+	return tuple(
+		dict.fromkeys(
+			(
+				*(CHROME_DOCKER_ARGS if docker else ()),
+				*(CHROME_HEADLESS_ARGS if headless else ()),
+				*(CHROME_DISABLE_SECURITY_ARGS if disable_security else ()),
+				*(CHROME_DETERMINISTIC_RENDERING_ARGS if deterministic_rendering else ()),
+			)
+		)
+	)
+
+
 def get_window_adjustments() -> tuple[int, int]:
 	"""Returns recommended x, y offsets for window positioning"""
 
@@ -446,11 +463,8 @@ class BrowserLaunchArgs(BaseModel):
 	@staticmethod
 	def args_as_dict(args: list[str]) -> dict[str, str]:
 		"""Return the extra launch CLI args as a dictionary."""
-		args_dict = {}
-		for arg in args:
-			key, value, *_ = [*arg.split('=', 1), '', '', '']
-			args_dict[key.strip().lstrip('-')] = value.strip()
-		return args_dict
+		# partition() splits on the first '=' in one C call (value is '' when there is none), later duplicates win
+		return {key.strip().lstrip('-'): value.strip() for key, _, value in (arg.partition('=') for arg in args)}
 
 	@staticmethod
 	def args_as_list(args: dict[str, str]) -> list[str]:
@@ -845,7 +859,10 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		"""Get the list of all Chrome CLI launch args for this profile (compiled from defaults, user-provided, and system-specific)."""
 
 		if isinstance(self.ignore_default_args, list):
-			default_args = set(CHROME_DEFAULT_ARGS) - set(self.ignore_default_args)
+			# Filter the shared CHROME_DEFAULT_ARGS list in place of copying it into a set, which also keeps the
+			# defaults in their declared order instead of hash order (launch args were reshuffled on every run)
+			ignored_args = set(self.ignore_default_args)
+			default_args = [arg for arg in CHROME_DEFAULT_ARGS if arg not in ignored_args]
 		elif self.ignore_default_args is True:
 			default_args = []
 		elif not self.ignore_default_args:
@@ -859,10 +876,12 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 			*self.args,
 			f'--user-data-dir={self.user_data_dir}',
 			f'--profile-directory={self.profile_directory}',
-			*(CHROME_DOCKER_ARGS if (CONFIG.IN_DOCKER or not self.chromium_sandbox) else []),
-			*(CHROME_HEADLESS_ARGS if self.headless else []),
-			*(CHROME_DISABLE_SECURITY_ARGS if self.disable_security else []),
-			*(CHROME_DETERMINISTIC_RENDERING_ARGS if self.deterministic_rendering else []),
+			*_get_flag_args(
+				docker=bool(CONFIG.IN_DOCKER or not self.chromium_sandbox),
+				headless=bool(self.headless),
+				disable_security=self.disable_security,
+				deterministic_rendering=self.deterministic_rendering,
+			),
 			*(
 				[f'--window-size={self.window_size["width"]},{self.window_size["height"]}']
 				if self.window_size
@@ -903,15 +922,9 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 			else:
 				non_disable_features_args.append(arg)
 
-		# Remove duplicates while preserving order
+		# Remove duplicates while preserving order (dict.fromkeys dedupes in one pass, first occurrence wins)
 		if disable_features_values:
-			unique_features = []
-			seen = set()
-			for feature in disable_features_values:
-				feature = feature.strip()
-				if feature and feature not in seen:
-					unique_features.append(feature)
-					seen.add(feature)
+			unique_features = [feature for feature in dict.fromkeys(map(str.strip, disable_features_values)) if feature]
 
 			# Add merged disable-features back
 			non_disable_features_args.append(f'--disable-features={",".join(unique_features)}')
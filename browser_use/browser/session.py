@@ -1,6 +1,7 @@
 """Event-driven browser session with backwards compatibility."""
 
 import asyncio
+import json
 import logging
 import re
 import time
@@ -63,6 +64,334 @@ _LOGGED_UNIQUE_SESSION_IDS = set()  # track unique session IDs that have been lo
 red = '\033[91m'
 reset = '\033[0m'
 
+# Static highlight scripts, defined once so add_highlights()/remove_highlights() don't rebuild them on every call
+_REMOVE_HIGHLIGHTS_SCRIPT = """
+(function() {
+	// Remove all browser-use highlight elements
+	const highlights = document.querySelectorAll('[data-browser-use-highlight]');
+	console.log('Removing', highlights.length, 'browser-use highlight elements');
+	highlights.forEach(el => el.remove());
+
+	// Also remove by ID in case selector missed anything
+	const highlightContainer = document.getElementById('browser-use-debug-highlights');
+	if (highlightContainer) {
+		console.log('Removing highlight container by ID');
+		highlightContainer.remove();
+	}
+
+	// Final cleanup - remove any orphaned tooltips
+	const orphanedTooltips = document.querySelectorAll('[data-browser-use-highlight="tooltip"]');
+	orphanedTooltips.forEach(el => el.remove());
+
+	return { removed: highlights.length };
+})();
+"""
+
+# Proven highlighting script from v0.6.0 with fixed positioning.
+# NOTE: this is an uncalled function expression - add_highlights() appends `(<flat elements json>)` to invoke it,
+# so do not add a trailing `();` here.
+_ADD_HIGHLIGHTS_SCRIPT = """
+(function(flatElements) {
+	// Columnar payload: [x, y, width, height, backend_node_id] repeated per element, no per-element keys
+	const FIELDS_PER_ELEMENT = 5;
+	const elementCount = flatElements.length / FIELDS_PER_ELEMENT;
+	console.log('=== BROWSER-USE HIGHLIGHTING ===');
+	console.log('Highlighting', elementCount, 'interactive elements');
+
+	// Double-check: Remove any existing highlight container first
+	const existingContainer = document.getElementById('browser-use-debug-highlights');
+	if (existingContainer) {
+		console.log('⚠️ Found existing highlight container, removing it first');
+		existingContainer.remove();
+	}
+
+	// Also remove any stray highlight elements
+	const strayHighlights = document.querySelectorAll('[data-browser-use-highlight]');
+	if (strayHighlights.length > 0) {
+		console.log('⚠️ Found', strayHighlights.length, 'stray highlight elements, removing them');
+		strayHighlights.forEach(el => el.remove());
+	}
+
+	// Stale highlights are cleared above either way, but don't build an overlay the document can't hold yet
+	// (no body) or that the in-progress navigation/parse is about to throw away
+	if (!document.body || document.readyState === 'loading') {
+		console.log('Document still loading, skipping highlights');
+		return { added: 0 };
+	}
+
+	// Use maximum z-index for visibility
+	const HIGHLIGHT_Z_INDEX = 2147483647;
+
+	// Create container for all highlights - use FIXED positioning (key insight from v0.6.0)
+	const container = document.createElement('div');
+	container.id = 'browser-use-debug-highlights';
+	container.setAttribute('data-browser-use-highlight', 'container');
+
+	container.style.cssText = `
+		position: absolute;
+		top: 0;
+		left: 0;
+		width: 100vw;
+		height: 100vh;
+		pointer-events: none;
+		z-index: ${HIGHLIGHT_Z_INDEX};
+		overflow: visible;
+		margin: 0;
+		padding: 0;
+		border: none;
+		outline: none;
+		box-shadow: none;
+		background: none;
+		font-family: inherit;
+	`;
+
+	// The static look of every highlight (outline box + label) lives in one constructable stylesheet adopted by a
+	// shadow root on the container: the CSS is parsed once per call and shared by all highlights, which then only
+	// carry their own position inline, and page styles can't leak into the overlay.
+	// (Adopted sheets, not a <style> tag or innerHTML: those are blocked by strict CSP / Trusted Types pages.)
+	const highlightSheet = new CSSStyleSheet();
+	highlightSheet.replaceSync(`
+		.highlight {
+			position: absolute;
+			outline: 2px dashed #4a90e2;
+			outline-offset: -2px;
+			background: transparent;
+			pointer-events: none;
+			box-sizing: content-box;
+			transition: outline 0.2s ease;
+			margin: 0;
+			padding: 0;
+			border: none;
+		}
+		.label {
+			position: absolute;
+			top: -20px;
+			left: 0;
+			background-color: #4a90e2;
+			color: white;
+			padding: 2px 6px;
+			font-size: 11px;
+			font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace;
+			font-weight: bold;
+			border-radius: 3px;
+			white-space: nowrap;
+			z-index: ${HIGHLIGHT_Z_INDEX};
+			box-shadow: 0 2px 4px rgba(0,0,0,0.3);
+			border: none;
+			outline: none;
+			margin: 0;
+			line-height: 1.2;
+		}
+	`);
+	const highlightRoot = container.attachShadow({ mode: 'open' });
+	highlightRoot.adoptedStyleSheets = [highlightSheet];
+
+	// Build one highlight (outline box + label) once and clone it per element
+	const highlightTemplate = document.createElement('div');
+	highlightTemplate.className = 'highlight';
+	highlightTemplate.setAttribute('data-browser-use-highlight', 'element');
+	const labelTemplate = document.createElement('div');
+	labelTemplate.className = 'label';
+	highlightTemplate.appendChild(labelTemplate);
+
+	// Add highlights for each element (the container is still detached, so this triggers no layout)
+	for (let i = 0; i < flatElements.length; i += FIELDS_PER_ELEMENT) {
+		const backendNodeId = flatElements[i + 4];
+		const highlight = highlightTemplate.cloneNode(true);
+		highlight.setAttribute('data-element-id', backendNodeId);
+		const style = highlight.style;
+		style.left = `${flatElements[i]}px`;
+		style.top = `${flatElements[i + 1]}px`;
+		style.width = `${flatElements[i + 2]}px`;
+		style.height = `${flatElements[i + 3]}px`;
+		highlight.firstChild.textContent = backendNodeId;
+		highlightRoot.appendChild(highlight);
+	}
+
+	// Add container to document
+	document.body.appendChild(container);
+
+	console.log('Highlighting complete - added', elementCount, 'highlights');
+	return { added: elementCount };
+})
+""".strip()
+
+
+# Interaction highlight scripts, also uncalled function expressions: highlight_interaction_element() and
+# highlight_coordinate_click() append the per-call arguments (rect/coordinates, color, duration in ms) to invoke them
+_INTERACTION_HIGHLIGHT_SCRIPT = """
+(function(rect, color, duration) {
+	// Scale corner size based on element dimensions to ensure gaps between corners
+	const maxCornerSize = 20;
+	const minCornerSize = 8;
+	const cornerSize = Math.max(
+		minCornerSize,
+		Math.min(maxCornerSize, Math.min(rect.width, rect.height) * 0.35)
+	);
+	const borderWidth = 3;
+	const startOffset = 10; // Starting offset in pixels
+	const finalOffset = -3; // Final position slightly outside the element
+
+	// Get current scroll position
+	const scrollX = window.pageXOffset || document.documentElement.scrollLeft || 0;
+	const scrollY = window.pageYOffset || document.documentElement.scrollTop || 0;
+
+	// Create container for all corners
+	const container = document.createElement('div');
+	container.setAttribute('data-browser-use-interaction-highlight', 'true');
+	container.style.cssText = `
+		position: absolute;
+		left: ${rect.x + scrollX}px;
+		top: ${rect.y + scrollY}px;
+		width: ${rect.width}px;
+		height: ${rect.height}px;
+		pointer-events: none;
+		z-index: 2147483647;
+	`;
+
+	// Create 4 corner brackets
+	const corners = [
+		{ pos: 'top-left', startX: -startOffset, startY: -startOffset, finalX: finalOffset, finalY: finalOffset },
+		{ pos: 'top-right', startX: startOffset, startY: -startOffset, finalX: -finalOffset, finalY: finalOffset },
+		{ pos: 'bottom-left', startX: -startOffset, startY: startOffset, finalX: finalOffset, finalY: -finalOffset },
+		{ pos: 'bottom-right', startX: startOffset, startY: startOffset, finalX: -finalOffset, finalY: -finalOffset }
+	];
+
+	corners.forEach(corner => {
+		const bracket = document.createElement('div');
+		bracket.style.cssText = `
+			position: absolute;
+			width: ${cornerSize}px;
+			height: ${cornerSize}px;
+			pointer-events: none;
+			transition: all 0.15s ease-out;
+		`;
+
+		// Position corners
+		if (corner.pos === 'top-left') {
+			bracket.style.top = '0';
+			bracket.style.left = '0';
+			bracket.style.borderTop = `${borderWidth}px solid ${color}`;
+			bracket.style.borderLeft = `${borderWidth}px solid ${color}`;
+			bracket.style.transform = `translate(${corner.startX}px, ${corner.startY}px)`;
+		} else if (corner.pos === 'top-right') {
+			bracket.style.top = '0';
+			bracket.style.right = '0';
+			bracket.style.borderTop = `${borderWidth}px solid ${color}`;
+			bracket.style.borderRight = `${borderWidth}px solid ${color}`;
+			bracket.style.transform = `translate(${corner.startX}px, ${corner.startY}px)`;
+		} else if (corner.pos === 'bottom-left') {
+			bracket.style.bottom = '0';
+			bracket.style.left = '0';
+			bracket.style.borderBottom = `${borderWidth}px solid ${color}`;
+			bracket.style.borderLeft = `${borderWidth}px solid ${color}`;
+			bracket.style.transform = `translate(${corner.startX}px, ${corner.startY}px)`;
+		} else if (corner.pos === 'bottom-right') {
+			bracket.style.bottom = '0';
+			bracket.style.right = '0';
+			bracket.style.borderBottom = `${borderWidth}px solid ${color}`;
+			bracket.style.borderRight = `${borderWidth}px solid ${color}`;
+			bracket.style.transform = `translate(${corner.startX}px, ${corner.startY}px)`;
+		}
+
+		container.appendChild(bracket);
+
+		// Animate to final position slightly outside the element
+		setTimeout(() => {
+			bracket.style.transform = `translate(${corner.finalX}px, ${corner.finalY}px)`;
+		}, 10);
+	});
+
+	document.body.appendChild(container);
+
+	// Auto-remove after duration
+	setTimeout(() => {
+		container.style.opacity = '0';
+		container.style.transition = 'opacity 0.3s ease-out';
+		setTimeout(() => container.remove(), 300);
+	}, duration);
+
+	return { created: true };
+})
+""".strip()
+
+_COORDINATE_HIGHLIGHT_SCRIPT = """
+(function(x, y, color, duration) {
+	// Get current scroll position
+	const scrollX = window.pageXOffset || document.documentElement.scrollLeft || 0;
+	const scrollY = window.pageYOffset || document.documentElement.scrollTop || 0;
+
+	// Create container
+	const container = document.createElement('div');
+	container.setAttribute('data-browser-use-coordinate-highlight', 'true');
+	container.style.cssText = `
+		position: absolute;
+		left: ${x + scrollX}px;
+		top: ${y + scrollY}px;
+		width: 0;
+		height: 0;
+		pointer-events: none;
+		z-index: 2147483647;
+	`;
+
+	// Create outer circle
+	const outerCircle = document.createElement('div');
+	outerCircle.style.cssText = `
+		position: absolute;
+		left: -15px;
+		top: -15px;
+		width: 30px;
+		height: 30px;
+		border: 3px solid ${color};
+		border-radius: 50%;
+		opacity: 0;
+		transform: scale(0.3);
+		transition: all 0.2s ease-out;
+	`;
+	container.appendChild(outerCircle);
+
+	// Create center dot
+	const centerDot = document.createElement('div');
+	centerDot.style.cssText = `
+		position: absolute;
+		left: -4px;
+		top: -4px;
+		width: 8px;
+		height: 8px;
+		background: ${color};
+		border-radius: 50%;
+		opacity: 0;
+		transform: scale(0);
+		transition: all 0.15s ease-out;
+	`;
+	container.appendChild(centerDot);
+
+	document.body.appendChild(container);
+
+	// Animate in
+	setTimeout(() => {
+		outerCircle.style.opacity = '0.8';
+		outerCircle.style.transform = 'scale(1)';
+		centerDot.style.opacity = '1';
+		centerDot.style.transform = 'scale(1)';
+	}, 10);
+
+	// Animate out and remove
+	setTimeout(() => {
+		outerCircle.style.opacity = '0';
+		outerCircle.style.transform = 'scale(1.5)';
+		centerDot.style.opacity = '0';
+		setTimeout(() => container.remove(), 300);
+	}, duration);
+
+	return { created: true };
+})
+""".strip()
+
+# Compact encoder for the highlight payload: no whitespace after separators shrinks the expression sent over CDP,
+# and reusing one encoder avoids json.dumps() constructing a new JSONEncoder for non-default separators each call
+_encode_highlight_payload = json.JSONEncoder(separators=(',', ':')).encode
+
 
 class Target(BaseModel):
 	"""Browser target (page, iframe, worker) - the actual entity being controlled.
@@ -974,7 +1303,9 @@ class BrowserSession(BaseModel):
 			)
 			timeout = 3.0 if same_domain else 8.0
 
-		nav_start_time = asyncio.get_event_loop().time()
+		# Bound once: the readiness poll below reads the clock every iteration
+		loop_time = asyncio.get_running_loop().time
+		nav_start_time = loop_time()
 
 		# Wrap Page.navigate() with timeout — heavy sites can block here for 10s+
 		# Use nav_timeout parameter if provided, otherwise default to 20.0
@@ -989,19 +1320,19 @@ class BrowserSession(BaseModel):
 				timeout=nav_timeout,
 			)
 		except TimeoutError:
-			duration_ms = (asyncio.get_event_loop().time() - nav_start_time) * 1000
+			duration_ms = (loop_time() - nav_start_time) * 1000
 			raise RuntimeError(f'Page.navigate() timed out after {nav_timeout}s ({duration_ms:.0f}ms) for {url}')
 
 		if nav_result.get('errorText'):
 			raise RuntimeError(f'Navigation failed: {nav_result["errorText"]}')
 
 		if wait_until == 'commit':
-			duration_ms = (asyncio.get_event_loop().time() - nav_start_time) * 1000
+			duration_ms = (loop_time() - nav_start_time) * 1000
 			self.logger.debug(f'✅ Page ready for {url} (commit, {duration_ms:.0f}ms)')
 			return
 
 		navigation_id = nav_result.get('loaderId')
-		start_time = asyncio.get_event_loop().time()
+		start_time = loop_time()
 		seen_events = []
 
 		if not hasattr(cdp_session, '_lifecycle_events'):
@@ -1019,7 +1350,7 @@ class BrowserSession(BaseModel):
 			acceptable_events.add('DOMContentLoaded')
 
 		poll_interval = 0.05
-		while (asyncio.get_event_loop().time() - start_time) < timeout:
+		while (loop_time() - start_time) < timeout:
 			try:
 				for event_data in list(cdp_session._lifecycle_events):
 					event_name = event_data.get('name')
@@ -1033,7 +1364,7 @@ class BrowserSession(BaseModel):
 						continue
 
 					if event_name in acceptable_events:
-						duration_ms = (asyncio.get_event_loop().time() - nav_start_time) * 1000
+						duration_ms = (loop_time() - nav_start_time) * 1000
 						self.logger.debug(f'✅ Page ready for {url} ({event_name}, {duration_ms:.0f}ms)')
 						return
 
@@ -1042,7 +1373,7 @@ class BrowserSession(BaseModel):
 
 			await asyncio.sleep(poll_interval)
 
-		duration_ms = (asyncio.get_event_loop().time() - nav_start_time) * 1000
+		duration_ms = (loop_time() - nav_start_time) * 1000
 		if not seen_events:
 			self.logger.error(
 				f'❌ No lifecycle events received for {url} after {duration_ms:.0f}ms! '
@@ -2229,8 +2560,6 @@ class BrowserSession(BaseModel):
 				if (not title or title == '') and (url.endswith('.pdf') or 'pdf' in url):
 					# PDF pages might not have a title, use URL filename
 					try:
-						from urllib.parse import urlparse
-
 						filename = urlparse(url).path.split('/')[-1]
 						if filename:
 							title = filename
@@ -2382,11 +2711,11 @@ class BrowserSession(BaseModel):
 				return None
 
 			# Try to find element in cached selector_map (avoids extra CDP call)
-			if self._cached_selector_map:
-				for node in self._cached_selector_map.values():
-					if node.backend_node_id == backend_node_id:
-						self.logger.debug(f'Found element at ({x}, {y}) in cached selector_map')
-						return node
+			# The selector map is keyed by backend_node_id, so this is a direct lookup rather than a scan
+			cached_node = self._cached_selector_map.get(backend_node_id)
+			if cached_node is not None and cached_node.backend_node_id == backend_node_id:
+				self.logger.debug(f'Found element at ({x}, {y}) in cached selector_map')
+				return cached_node
 
 			# Not in cache - fall back to CDP DOM.describeNode to get actual node info
 			try:
@@ -2625,30 +2954,8 @@ class BrowserSession(BaseModel):
 				# Get cached session
 				cdp_session = await self.get_or_create_cdp_session()
 
-				# Remove highlights via JavaScript - be thorough
-				script = """
-				(function() {
-					// Remove all browser-use highlight elements
-					const highlights = document.querySelectorAll('[data-browser-use-highlight]');
-					console.log('Removing', highlights.length, 'browser-use highlight elements');
-					highlights.forEach(el => el.remove());
-
-					// Also remove by ID in case selector missed anything
-					const highlightContainer = document.getElementById('browser-use-debug-highlights');
-					if (highlightContainer) {
-						console.log('Removing highlight container by ID');
-						highlightContainer.remove();
-					}
-
-					// Final cleanup - remove any orphaned tooltips
-					const orphanedTooltips = document.querySelectorAll('[data-browser-use-highlight="tooltip"]');
-					orphanedTooltips.forEach(el => el.remove());
-
-					return { removed: highlights.length };
-				})();
-				"""
 				result = await cdp_session.cdp_client.send.Runtime.evaluate(
-					params={'expression': script, 'returnByValue': True}, session_id=cdp_session.session_id
+					params={'expression': _REMOVE_HIGHLIGHTS_SCRIPT, 'returnByValue': True}, session_id=cdp_session.session_id
 				)
 
 				# Log the result for debugging
@@ -2803,105 +3110,11 @@ class BrowserSession(BaseModel):
 				return
 
 			# Create animated corner brackets that start offset and animate inward
-			script = f"""
-			(function() {{
-				const rect = {json.dumps({'x': rect.x, 'y': rect.y, 'width': rect.width, 'height': rect.height})};
-				const color = {json.dumps(color)};
-				const duration = {duration_ms};
-
-				// Scale corner size based on element dimensions to ensure gaps between corners
-				const maxCornerSize = 20;
-				const minCornerSize = 8;
-				const cornerSize = Math.max(
-					minCornerSize,
-					Math.min(maxCornerSize, Math.min(rect.width, rect.height) * 0.35)
-				);
-				const borderWidth = 3;
-				const startOffset = 10; // Starting offset in pixels
-				const finalOffset = -3; // Final position slightly outside the element
-
-				// Get current scroll position
-				const scrollX = window.pageXOffset || document.documentElement.scrollLeft || 0;
-				const scrollY = window.pageYOffset || document.documentElement.scrollTop || 0;
-
-				// Create container for all corners
-				const container = document.createElement('div');
-				container.setAttribute('data-browser-use-interaction-highlight', 'true');
-				container.style.cssText = `
-					position: absolute;
-					left: ${{rect.x + scrollX}}px;
-					top: ${{rect.y + scrollY}}px;
-					width: ${{rect.width}}px;
-					height: ${{rect.height}}px;
-					pointer-events: none;
-					z-index: 2147483647;
-				`;
-
-				// Create 4 corner brackets
-				const corners = [
-					{{ pos: 'top-left', startX: -startOffset, startY: -startOffset, finalX: finalOffset, finalY: finalOffset }},
-					{{ pos: 'top-right', startX: startOffset, startY: -startOffset, finalX: -finalOffset, finalY: finalOffset }},
-					{{ pos: 'bottom-left', startX: -startOffset, startY: startOffset, finalX: finalOffset, finalY: -finalOffset }},
-					{{ pos: 'bottom-right', startX: startOffset, startY: startOffset, finalX: -finalOffset, finalY: -finalOffset }}
-				];
-
-				corners.forEach(corner => {{
-					const bracket = document.createElement('div');
-					bracket.style.cssText = `
-						position: absolute;
-						width: ${{cornerSize}}px;
-						height: ${{cornerSize}}px;
-						pointer-events: none;
-						transition: all 0.15s ease-out;
-					`;
-
-					// Position corners
-					if (corner.pos === 'top-left') {{
-						bracket.style.top = '0';
-						bracket.style.left = '0';
-						bracket.style.borderTop = `${{borderWidth}}px solid ${{color}}`;
-						bracket.style.borderLeft = `${{borderWidth}}px solid ${{color}}`;
-						bracket.style.transform = `translate(${{corner.startX}}px, ${{corner.startY}}px)`;
-					}} else if (corner.pos === 'top-right') {{
-						bracket.style.top = '0';
-						bracket.style.right = '0';
-						bracket.style.borderTop = `${{borderWidth}}px solid ${{color}}`;
-						bracket.style.borderRight = `${{borderWidth}}px solid ${{color}}`;
-						bracket.style.transform = `translate(${{corner.startX}}px, ${{corner.startY}}px)`;
-					}} else if (corner.pos === 'bottom-left') {{
-						bracket.style.bottom = '0';
-						bracket.style.left = '0';
-						bracket.style.borderBottom = `${{borderWidth}}px solid ${{color}}`;
-						bracket.style.borderLeft = `${{borderWidth}}px solid ${{color}}`;
-						bracket.style.transform = `translate(${{corner.startX}}px, ${{corner.startY}}px)`;
-					}} else if (corner.pos === 'bottom-right') {{
-						bracket.style.bottom = '0';
-						bracket.style.right = '0';
-						bracket.style.borderBottom = `${{borderWidth}}px solid ${{color}}`;
-						bracket.style.borderRight = `${{borderWidth}}px solid ${{color}}`;
-						bracket.style.transform = `translate(${{corner.startX}}px, ${{corner.startY}}px)`;
-					}}
-
-					container.appendChild(bracket);
-
-					// Animate to final position slightly outside the element
-					setTimeout(() => {{
-						bracket.style.transform = `translate(${{corner.finalX}}px, ${{corner.finalY}}px)`;
-					}}, 10);
-				}});
-
-				document.body.appendChild(container);
-
-				// Auto-remove after duration
-				setTimeout(() => {{
-					container.style.opacity = '0';
-					container.style.transition = 'opacity 0.3s ease-out';
-					setTimeout(() => container.remove(), 300);
-				}}, duration);
-
-				return {{ created: true }};
-			}})();
-			"""
+			script = (
+				f'{_INTERACTION_HIGHLIGHT_SCRIPT}('
+				f'{json.dumps({"x": rect.x, "y": rect.y, "width": rect.width, "height": rect.height})}, '
+				f'{json.dumps(color)}, {duration_ms})'
+			)
 
 			# Fire and forget - don't wait for completion
 
@@ -2935,83 +3148,7 @@ class BrowserSession(BaseModel):
 			duration_ms = int(self.browser_profile.interaction_highlight_duration * 1000)
 
 			# Create animated crosshair and circle at the click coordinates
-			script = f"""
-			(function() {{
-				const x = {x};
-				const y = {y};
-				const color = {json.dumps(color)};
-				const duration = {duration_ms};
-
-				// Get current scroll position
-				const scrollX = window.pageXOffset || document.documentElement.scrollLeft || 0;
-				const scrollY = window.pageYOffset || document.documentElement.scrollTop || 0;
-
-				// Create container
-				const container = document.createElement('div');
-				container.setAttribute('data-browser-use-coordinate-highlight', 'true');
-				container.style.cssText = `
-					position: absolute;
-					left: ${{x + scrollX}}px;
-					top: ${{y + scrollY}}px;
-					width: 0;
-					height: 0;
-					pointer-events: none;
-					z-index: 2147483647;
-				`;
-
-				// Create outer circle
-				const outerCircle = document.createElement('div');
-				outerCircle.style.cssText = `
-					position: absolute;
-					left: -15px;
-					top: -15px;
-					width: 30px;
-					height: 30px;
-					border: 3px solid ${{color}};
-					border-radius: 50%;
-					opacity: 0;
-					transform: scale(0.3);
-					transition: all 0.2s ease-out;
-				`;
-				container.appendChild(outerCircle);
-
-				// Create center dot
-				const centerDot = document.createElement('div');
-				centerDot.style.cssText = `
-					position: absolute;
-					left: -4px;
-					top: -4px;
-					width: 8px;
-					height: 8px;
-					background: ${{color}};
-					border-radius: 50%;
-					opacity: 0;
-					transform: scale(0);
-					transition: all 0.15s ease-out;
-				`;
-				container.appendChild(centerDot);
-
-				document.body.appendChild(container);
-
-				// Animate in
-				setTimeout(() => {{
-					outerCircle.style.opacity = '0.8';
-					outerCircle.style.transform = 'scale(1)';
-					centerDot.style.opacity = '1';
-					centerDot.style.transform = 'scale(1)';
-				}}, 10);
-
-				// Animate out and remove
-				setTimeout(() => {{
-					outerCircle.style.opacity = '0';
-					outerCircle.style.transform = 'scale(1.5)';
-					centerDot.style.opacity = '0';
-					setTimeout(() => container.remove(), 300);
-				}}, duration);
-
-				return {{ created: true }};
-			}})();
-			"""
+			script = f'{_COORDINATE_HIGHLIGHT_SCRIPT}({x}, {y}, {json.dumps(color)}, {duration_ms})'
 
 			# Fire and forget - don't wait for completion
 			await cdp_session.cdp_client.send.Runtime.evaluate(
@@ -3028,166 +3165,32 @@ class BrowserSession(BaseModel):
 			return
 
 		try:
-			import json
-
-			# Convert selector_map to the format expected by the highlighting script
-			elements_data = []
-			for _, node in selector_map.items():
-				# Get bounding box using absolute position (includes iframe translations) if available
-				if node.absolute_position:
-					# Use absolute position which includes iframe coordinate translations
-					rect = node.absolute_position
-					bbox = {'x': rect.x, 'y': rect.y, 'width': rect.width, 'height': rect.height}
-
-					# Only include elements with valid bounding boxes
-					if bbox and bbox.get('width', 0) > 0 and bbox.get('height', 0) > 0:
-						element = {
-							'x': bbox['x'],
-							'y': bbox['y'],
-							'width': bbox['width'],
-							'height': bbox['height'],
-							'element_name': node.node_name,
-							'is_clickable': node.snapshot_node.is_clickable if node.snapshot_node else True,
-							'is_scrollable': getattr(node, 'is_scrollable', False),
-							'attributes': node.attributes or {},
-							'frame_id': getattr(node, 'frame_id', None),
-							'node_id': node.node_id,
-							'backend_node_id': node.backend_node_id,
-							'xpath': node.xpath,
-							'text_content': node.get_all_children_text()[:50]
-							if hasattr(node, 'get_all_children_text')
-							else node.node_value[:50],
-						}
-						elements_data.append(element)
+			# Convert selector_map to the flat [x, y, width, height, backend_node_id, ...] array the highlighting script reads,
+			# in one comprehension. absolute_position includes iframe coordinate translations; zero-area elements can't be
+			# seen so they are skipped. Only the fields _ADD_HIGHLIGHTS_SCRIPT reads are sent (attributes, xpath and text
+			# content inflated the payload and cost tree walks), as flat rows so the JSON carries no per-element keys
+			elements_data: list[float | int] = [
+				value
+				for node in selector_map.values()
+				if (rect := node.absolute_position) and rect.width > 0 and rect.height > 0
+				for value in (rect.x, rect.y, rect.width, rect.height, node.backend_node_id)
+			]
 
 			if not elements_data:
 				self.logger.debug('⚠️ No valid elements to highlight')
+				# Nothing to draw, but still clear highlights left over from the previous step
+				await self.remove_highlights()
 				return
 
-			self.logger.debug(f'📍 Creating highlights for {len(elements_data)} elements')
-
-			# Always remove existing highlights first
-			await self.remove_highlights()
-
-			# Add a small delay to ensure removal completes
-			import asyncio
-
-			await asyncio.sleep(0.05)
+			self.logger.debug(f'📍 Creating highlights for {len(elements_data) // 5} elements')
 
 			# Get CDP session
 			cdp_session = await self.get_or_create_cdp_session()
 
-			# Create the proven highlighting script from v0.6.0 with fixed positioning
-			script = f"""
-			(function() {{
-				// Interactive elements data
-				const interactiveElements = {json.dumps(elements_data)};
-
-				console.log('=== BROWSER-USE HIGHLIGHTING ===');
-				console.log('Highlighting', interactiveElements.length, 'interactive elements');
-
-				// Double-check: Remove any existing highlight container first
-				const existingContainer = document.getElementById('browser-use-debug-highlights');
-				if (existingContainer) {{
-					console.log('⚠️ Found existing highlight container, removing it first');
-					existingContainer.remove();
-				}}
-
-				// Also remove any stray highlight elements
-				const strayHighlights = document.querySelectorAll('[data-browser-use-highlight]');
-				if (strayHighlights.length > 0) {{
-					console.log('⚠️ Found', strayHighlights.length, 'stray highlight elements, removing them');
-					strayHighlights.forEach(el => el.remove());
-				}}
-
-				// Use maximum z-index for visibility
-				const HIGHLIGHT_Z_INDEX = 2147483647;
-
-				// Create container for all highlights - use FIXED positioning (key insight from v0.6.0)
-				const container = document.createElement('div');
-				container.id = 'browser-use-debug-highlights';
-				container.setAttribute('data-browser-use-highlight', 'container');
-
-				container.style.cssText = `
-					position: absolute;
-					top: 0;
-					left: 0;
-					width: 100vw;
-					height: 100vh;
-					pointer-events: none;
-					z-index: ${{HIGHLIGHT_Z_INDEX}};
-					overflow: visible;
-					margin: 0;
-					padding: 0;
-					border: none;
-					outline: none;
-					box-shadow: none;
-					background: none;
-					font-family: inherit;
-				`;
-
-				// Helper function to create text elements safely
-				function createTextElement(tag, text, styles) {{
-					const element = document.createElement(tag);
-					element.textContent = text;
-					if (styles) element.style.cssText = styles;
-					return element;
-				}}
-
-				// Add highlights for each element
-				interactiveElements.forEach((element, index) => {{
-					const highlight = document.createElement('div');
-					highlight.setAttribute('data-browser-use-highlight', 'element');
-					highlight.setAttribute('data-element-id', element.backend_node_id);
-					highlight.style.cssText = `
-						position: absolute;
-						left: ${{element.x}}px;
-						top: ${{element.y}}px;
-						width: ${{element.width}}px;
-						height: ${{element.height}}px;
-						outline: 2px dashed #4a90e2;
-						outline-offset: -2px;
-						background: transparent;
-						pointer-events: none;
-						box-sizing: content-box;
-						transition: outline 0.2s ease;
-						margin: 0;
-						padding: 0;
-						border: none;
-					`;
-
-					// Enhanced label with backend node ID
-					const label = createTextElement('div', element.backend_node_id, `
-						position: absolute;
-						top: -20px;
-						left: 0;
-						background-color: #4a90e2;
-						color: white;
-						padding: 2px 6px;
-						font-size: 11px;
-						font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace;
-						font-weight: bold;
-						border-radius: 3px;
-						white-space: nowrap;
-						z-index: ${{HIGHLIGHT_Z_INDEX + 1}};
-						box-shadow: 0 2px 4px rgba(0,0,0,0.3);
-						border: none;
-						outline: none;
-						margin: 0;
-						line-height: 1.2;
-					`);
-
-					highlight.appendChild(label);
-					container.appendChild(highlight);
-				}});
-
-				// Add container to document
-				document.body.appendChild(container);
-
-				console.log('Highlighting complete - added', interactiveElements.length, 'highlights');
-				return {{ added: interactiveElements.length }};
-			}})();
-			"""
+			# The static highlighting script is built once at import time, only the element data is serialized per call.
+			# It clears any existing highlight container and stray highlight elements itself before drawing, so removal
+			# and drawing happen in this single Runtime.evaluate round-trip (no separate remove_highlights() call).
+			script = f'{_ADD_HIGHLIGHTS_SCRIPT}({_encode_highlight_payload(elements_data)})'
 
 			# Execute the script
 			result = await cdp_session.cdp_client.send.Runtime.evaluate(
@@ -3556,7 +3559,7 @@ class BrowserSession(BaseModel):
 		if url == 'about:blank' and include_about:
 			url_allowed = True
 
-		if (url.startswith('http://') or url.startswith('https://')) and include_http:
+		if url.startswith(('http://', 'https://')) and include_http:
 			url_allowed = True
 
 		if target_type in ('service_worker', 'shared_worker', 'worker') and include_workers:
@@ -3603,6 +3606,7 @@ class BrowserSession(BaseModel):
 		all_targets = targets
 
 		# First pass: collect frame trees from ALL targets
+		targets_with_sessions: list[tuple[dict, CDPSession]] = []
 		for target in all_targets:
 			target_id = target['targetId']
 
@@ -3629,85 +3633,98 @@ class BrowserSession(BaseModel):
 
 			if cdp_session:
 				target_sessions[target_id] = cdp_session.session_id
+				targets_with_sessions.append((target, cdp_session))
+
+		# Fetch all frame trees concurrently instead of one target after another
+		# (not all target types support Page.getFrameTree, failures are returned and handled per target below)
+		frame_tree_results = await asyncio.gather(
+			*(
+				cdp_session.cdp_client.send.Page.getFrameTree(session_id=cdp_session.session_id)
+				for _, cdp_session in targets_with_sessions
+			),
+			return_exceptions=True,
+		)
 
-				try:
-					# Try to get frame tree (not all target types support this)
-					frame_tree_result = await cdp_session.cdp_client.send.Page.getFrameTree(session_id=cdp_session.session_id)
-
-					# Process the frame tree recursively
-					def process_frame_tree(node, parent_frame_id=None):
-						"""Recursively process frame tree and add to all_frames."""
-						frame = node.get('frame', {})
-						current_frame_id = frame.get('id')
-
-						if current_frame_id:
-							# For iframe targets, check if the frame has a parentId field
-							# This indicates it's an OOPIF with a parent in another target
-							actual_parent_id = frame.get('parentId') or parent_frame_id
-
-							# Create frame info with all CDP response data plus our additions
-							frame_info = {
-								**frame,  # Include all original frame data: id, url, parentId, etc.
-								'frameTargetId': target_id,  # Target that can access this frame
-								'parentFrameId': actual_parent_id,  # Use parentId from frame if available
-								'childFrameIds': [],  # Will be populated below
-								'isCrossOrigin': False,  # Will be determined based on context
-								'isValidTarget': self._is_valid_target(
-									target,
-									include_http=True,
-									include_about=True,
-									include_pages=True,
-									include_iframes=True,
-									include_workers=False,
-									include_chrome=False,  # chrome://newtab, chrome://settings, etc. are not valid frames we can control (for sanity reasons)
-									include_chrome_extensions=False,  # chrome-extension://
-									include_chrome_error=False,  # chrome-error://  (e.g. when iframes fail to load or are blocked by uBlock Origin)
-								),
-							}
-
-							# Check if frame is cross-origin based on crossOriginIsolatedContextType
-							cross_origin_type = frame.get('crossOriginIsolatedContextType')
-							if cross_origin_type and cross_origin_type != 'NotIsolated':
-								frame_info['isCrossOrigin'] = True
+		for (target, _), frame_tree_result in zip(targets_with_sessions, frame_tree_results):
+			target_id = target['targetId']
+			try:
+				if isinstance(frame_tree_result, BaseException):
+					raise frame_tree_result
+
+				# Process the frame tree recursively
+				def process_frame_tree(node, parent_frame_id=None):
+					"""Recursively process frame tree and add to all_frames."""
+					frame = node.get('frame', {})
+					current_frame_id = frame.get('id')
+
+					if current_frame_id:
+						# For iframe targets, check if the frame has a parentId field
+						# This indicates it's an OOPIF with a parent in another target
+						actual_parent_id = frame.get('parentId') or parent_frame_id
+
+						# Create frame info with all CDP response data plus our additions
+						frame_info = {
+							**frame,  # Include all original frame data: id, url, parentId, etc.
+							'frameTargetId': target_id,  # Target that can access this frame
+							'parentFrameId': actual_parent_id,  # Use parentId from frame if available
+							'childFrameIds': [],  # Will be populated below
+							'isCrossOrigin': False,  # Will be determined based on context
+							'isValidTarget': self._is_valid_target(
+								target,
+								include_http=True,
+								include_about=True,
+								include_pages=True,
+								include_iframes=True,
+								include_workers=False,
+								include_chrome=False,  # chrome://newtab, chrome://settings, etc. are not valid frames we can control (for sanity reasons)
+								include_chrome_extensions=False,  # chrome-extension://
+								include_chrome_error=False,  # chrome-error://  (e.g. when iframes fail to load or are blocked by uBlock Origin)
+							),
+						}
 
-							# For iframe targets, the frame itself is likely cross-origin
+						# Check if frame is cross-origin based on crossOriginIsolatedContextType
+						cross_origin_type = frame.get('crossOriginIsolatedContextType')
+						if cross_origin_type and cross_origin_type != 'NotIsolated':
+							frame_info['isCrossOrigin'] = True
+
+						# For iframe targets, the frame itself is likely cross-origin
+						if target.get('type') == 'iframe':
+							frame_info['isCrossOrigin'] = True
+
+						# Skip cross-origin frames if support is disabled
+						if not include_cross_origin and frame_info.get('isCrossOrigin'):
+							return  # Skip this frame and its children
+
+						# Add child frame IDs (note: OOPIFs won't appear here)
+						child_frames = node.get('childFrames', [])
+						for child in child_frames:
+							child_frame = child.get('frame', {})
+							child_frame_id = child_frame.get('id')
+							if child_frame_id:
+								frame_info['childFrameIds'].append(child_frame_id)
+
+						# Store or merge frame info
+						if current_frame_id in all_frames:
+							# Frame already seen from another target, merge info
+							existing = all_frames[current_frame_id]
+							# If this is an iframe target, it has direct access to the frame
 							if target.get('type') == 'iframe':
-								frame_info['isCrossOrigin'] = True
-
-							# Skip cross-origin frames if support is disabled
-							if not include_cross_origin and frame_info.get('isCrossOrigin'):
-								return  # Skip this frame and its children
+								existing['frameTargetId'] = target_id
+								existing['isCrossOrigin'] = True
+						else:
+							all_frames[current_frame_id] = frame_info
 
-							# Add child frame IDs (note: OOPIFs won't appear here)
-							child_frames = node.get('childFrames', [])
+						# Process child frames recursively (only if we're not skipping this frame)
+						if include_cross_origin or not frame_info.get('isCrossOrigin'):
 							for child in child_frames:
-								child_frame = child.get('frame', {})
-								child_frame_id = child_frame.get('id')
-								if child_frame_id:
-									frame_info['childFrameIds'].append(child_frame_id)
-
-							# Store or merge frame info
-							if current_frame_id in all_frames:
-								# Frame already seen from another target, merge info
-								existing = all_frames[current_frame_id]
-								# If this is an iframe target, it has direct access to the frame
-								if target.get('type') == 'iframe':
-									existing['frameTargetId'] = target_id
-									existing['isCrossOrigin'] = True
-							else:
-								all_frames[current_frame_id] = frame_info
-
-							# Process child frames recursively (only if we're not skipping this frame)
-							if include_cross_origin or not frame_info.get('isCrossOrigin'):
-								for child in child_frames:
-									process_frame_tree(child, current_frame_id)
-
-					# Process the entire frame tree
-					process_frame_tree(frame_tree_result.get('frameTree', {}))
+								process_frame_tree(child, current_frame_id)
 
-				except Exception as e:
-					# Target doesn't support Page domain or has no frames
-					self.logger.debug(f'Failed to get frame tree for target {target_id}: {e}')
+				# Process the entire frame tree
+				process_frame_tree(frame_tree_result.get('frameTree', {}))
+
+			except Exception as e:
+				# Target doesn't support Page domain or has no frames
+				self.logger.debug(f'Failed to get frame tree for target {target_id}: {e}')
 
 		# Second pass: populate backend node IDs and parent target IDs
 		# Only do this if cross-origin support is enabled
@@ -3723,6 +3740,8 @@ class BrowserSession(BaseModel):
 			all_frames: Frame hierarchy dict to populate
 			target_sessions: Active target sessions
 		"""
+		# Collect the frames whose owner lives in a target we have a session for
+		frames_to_resolve: list[tuple[str, dict, str]] = []
 		for frame_id_iter, frame_info in all_frames.items():
 			parent_frame_id = frame_info.get('parentFrameId')
 
@@ -3736,23 +3755,39 @@ class BrowserSession(BaseModel):
 				# Try to get backend node ID from parent context
 				if parent_target_id in target_sessions:
 					assert parent_target_id is not None
-					parent_session_id = target_sessions[parent_target_id]
-					try:
-						# Enable DOM domain
-						await self.cdp_client.send.DOM.enable(session_id=parent_session_id)
+					frames_to_resolve.append((frame_id_iter, frame_info, target_sessions[parent_target_id]))
 
-						# Get frame owner info to find backend node ID
-						frame_owner = await self.cdp_client.send.DOM.getFrameOwner(
-							params={'frameId': frame_id_iter}, session_id=parent_session_id
-						)
+		if not frames_to_resolve:
+			return
 
-						if frame_owner:
-							frame_info['backendNodeId'] = frame_owner.get('backendNodeId')
-							frame_info['nodeId'] = frame_owner.get('nodeId')
+		# Enable the DOM domain once per parent session instead of once per frame
+		parent_session_ids = {parent_session_id for _, _, parent_session_id in frames_to_resolve}
 
-					except Exception:
-						# Frame owner not available (likely cross-origin)
-						pass
+		async def enable_dom(parent_session_id: str) -> None:
+			try:
+				await self.cdp_client.send.DOM.enable(session_id=parent_session_id)
+			except Exception:
+				pass
+
+		await asyncio.gather(*(enable_dom(parent_session_id) for parent_session_id in parent_session_ids))
+
+		async def resolve_frame_owner(frame_id: str, frame_info: dict, parent_session_id: str) -> None:
+			try:
+				# Get frame owner info to find backend node ID
+				frame_owner = await self.cdp_client.send.DOM.getFrameOwner(
+					params={'frameId': frame_id}, session_id=parent_session_id
+				)
+
+				if frame_owner:
+					frame_info['backendNodeId'] = frame_owner.get('backendNodeId')
+					frame_info['nodeId'] = frame_owner.get('nodeId')
+
+			except Exception:
+				# Frame owner not available (likely cross-origin)
+				pass
+
+		# Resolve all frame owners concurrently rather than one round-trip after another
+		await asyncio.gather(*(resolve_frame_owner(*frame) for frame in frames_to_resolve))
 
 	async def find_frame_target(self, frame_id: str, all_frames: dict[str, dict] | None = None) -> dict | None:
 		"""Find the frame info for a specific frame ID.
@@ -3791,6 +3826,11 @@ class BrowserSession(BaseModel):
 		if not self.browser_profile.cross_origin_iframes:
 			return await self.get_or_create_cdp_session()
 
+		# Page and OOPIF targets share their id with their root frame, so a live target with this id owns the
+		# frame; only frames nested inside another target need the full multi-target frame hierarchy scan
+		if self.session_manager and self.session_manager.get_target(frame_id) is not None:
+			return await self.get_or_create_cdp_session(frame_id, focus=False)
+
 		# Get complete frame hierarchy
 		all_frames, target_sessions = await self.get_all_frames()
 
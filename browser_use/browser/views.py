@@ -65,7 +65,7 @@ class PageInfo(BaseModel):
 	# Page statistics are now computed dynamically instead of stored
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkRequest:
 	"""Information about a pending network request"""
 
@@ -75,7 +75,7 @@ class NetworkRequest:
 	resource_type: str | None = None  # e.g., 'Document', 'Stylesheet', 'Image', 'Script', 'XHR', 'Fetch'
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginationButton:
 	"""Information about a pagination button detected on the page"""
 
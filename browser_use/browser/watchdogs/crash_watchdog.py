@@ -23,6 +23,9 @@ from browser_use.utils import create_task_with_error_handling
 if TYPE_CHECKING:
 	pass
 
+# One hashed membership test in _is_new_tab_page() instead of comparing against each URL in turn
+_NEW_TAB_PAGE_URLS = frozenset({'about:blank', 'chrome://new-tab-page/', 'chrome://newtab/'})
+
 
 class NetworkRequestTracker:
 	"""Tracks ongoing network requests."""
@@ -333,4 +336,4 @@ class CrashWatchdog(BaseWatchdog):
 	@staticmethod
 	def _is_new_tab_page(url: str) -> bool:
 		"""Check if URL is a new tab page."""
-		return url in ['about:blank', 'chrome://new-tab-page/', 'chrome://newtab/']
+		return url in _NEW_TAB_PAGE_URLS
@@ -1,6 +1,8 @@
 """DOM watchdog for browser DOM tree management using CDP."""
 
 import asyncio
+import heapq
+import logging
 import time
 from typing import TYPE_CHECKING
 
@@ -61,14 +63,14 @@ class DOMWatchdog(BaseWatchdog):
 		import json
 
 		try:
-			# Get all events from history, sorted by creation time (most recent first)
-			all_events = sorted(
-				self.browser_session.event_bus.event_history.values(), key=lambda e: e.event_created_at.timestamp(), reverse=True
+			# Get the most recent events from history (most recent first) without sorting the whole history
+			recent_events = heapq.nlargest(
+				limit, self.browser_session.event_bus.event_history.values(), key=lambda e: e.event_created_at.timestamp()
 			)
 
-			# Take the most recent events and create JSON-serializable data
+			# Create JSON-serializable data for the most recent events
 			recent_events_data = []
-			for event in all_events[:limit]:
+			for event in recent_events:
 				event_data = {
 					'event_type': event.event_type,
 					'timestamp': event.event_created_at.isoformat(),
@@ -205,19 +207,20 @@ class DOMWatchdog(BaseWatchdog):
 				doc_loading = data.get('document_loading', False)
 				debug_info = data.get('debug', {})
 
-				# Get all domains that had recent activity (from JS)
-				all_domains = debug_info.get('all_domains', [])
-				all_domains_str = ', '.join(sorted(all_domains)[:5]) if all_domains else 'none'
-				if len(all_domains) > 5:
-					all_domains_str += f' +{len(all_domains) - 5} more'
+				# Debug logging (only the first 5 domains alphabetically are shown, so nsmallest instead of sorting them all)
+				if self.logger.isEnabledFor(logging.DEBUG):
+					# Get all domains that had recent activity (from JS)
+					all_domains = debug_info.get('all_domains', [])
+					all_domains_str = ', '.join(heapq.nsmallest(5, all_domains)) if all_domains else 'none'
+					if len(all_domains) > 5:
+						all_domains_str += f' +{len(all_domains) - 5} more'
 
-				# Debug logging
-				self.logger.debug(
-					f'🔍 Network check: document.readyState={doc_state}, loading={doc_loading}, '
-					f'total_resources={debug_info.get("total_resources", 0)}, '
-					f'responseEnd=0: {debug_info.get("with_response_end_zero", 0)}, '
-					f'after_filters={len(pending)}, domains=[{all_domains_str}]'
-				)
+					self.logger.debug(
+						f'🔍 Network check: document.readyState={doc_state}, loading={doc_loading}, '
+						f'total_resources={debug_info.get("total_resources", 0)}, '
+						f'responseEnd=0: {debug_info.get("with_response_end_zero", 0)}, '
+						f'after_filters={len(pending)}, domains=[{all_domains_str}]'
+					)
 
 				# Convert to NetworkRequest objects
 				network_requests = []
@@ -374,73 +377,93 @@ class DOMWatchdog(BaseWatchdog):
 					suppress_exceptions=True,
 				)
 
-			# Start clean screenshot task if requested (without JS highlights)
-			if event.include_screenshot:
-				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: 📸 Starting clean screenshot task...')
-				screenshot_task = create_task_with_error_handling(
-					self._capture_clean_screenshot(),
-					name='capture_screenshot',
-					logger_instance=self.logger,
-					suppress_exceptions=True,
-				)
+			# Fetch page info (Page.getLayoutMetrics) alongside the DOM build and screenshot instead of as another
+			# sequential CDP round-trip after both have finished
+			page_info_task = create_task_with_error_handling(
+				self._get_page_info_or_none(),
+				name='get_page_info',
+				logger_instance=self.logger,
+				suppress_exceptions=True,
+			)
 
-			# Wait for both tasks to complete
-			content = None
-			screenshot_b64 = None
+			try:
+				# Start clean screenshot task if requested (without JS highlights)
+				if event.include_screenshot:
+					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: 📸 Starting clean screenshot task...')
+					screenshot_task = create_task_with_error_handling(
+						self._capture_clean_screenshot(),
+						name='capture_screenshot',
+						logger_instance=self.logger,
+						suppress_exceptions=True,
+					)
 
-			if dom_task:
-				try:
-					content = await dom_task
-					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ DOM tree build completed')
-				except Exception as e:
-					self.logger.warning(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: DOM build failed: {e}, using minimal state')
-					content = SerializedDOMState(_root=None, selector_map={})
-			else:
-				content = SerializedDOMState(_root=None, selector_map={})
+				# Wait for both tasks to complete
+				content = None
+				screenshot_b64 = None
 
-			if screenshot_task:
-				try:
-					screenshot_b64 = await screenshot_task
-					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ Clean screenshot captured')
-				except Exception as e:
-					self.logger.warning(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Clean screenshot failed: {e}')
-					screenshot_b64 = None
+				if dom_task:
+					try:
+						content = await dom_task
+						self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ DOM tree build completed')
+					except Exception as e:
+						self.logger.warning(
+							f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: DOM build failed: {e}, using minimal state'
+						)
+						content = SerializedDOMState(_root=None, selector_map={})
+				else:
+					content = SerializedDOMState(_root=None, selector_map={})
 
-			# Add browser-side highlights for user visibility
-			if content and content.selector_map and self.browser_session.browser_profile.dom_highlight_elements:
-				try:
-					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: 🎨 Adding browser-side highlights...')
-					await self.browser_session.add_highlights(content.selector_map)
-					self.logger.debug(
-						f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ Added browser highlights for {len(content.selector_map)} elements'
-					)
-				except Exception as e:
-					self.logger.warning(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Browser highlighting failed: {e}')
+				if screenshot_task:
+					try:
+						screenshot_b64 = await screenshot_task
+						self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ Clean screenshot captured')
+					except Exception as e:
+						self.logger.warning(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Clean screenshot failed: {e}')
+						screenshot_b64 = None
+
+				# Add browser-side highlights for user visibility
+				if content and content.selector_map and self.browser_session.browser_profile.dom_highlight_elements:
+					try:
+						self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: 🎨 Adding browser-side highlights...')
+						await self.browser_session.add_highlights(content.selector_map)
+						self.logger.debug(
+							f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ Added browser highlights for {len(content.selector_map)} elements'
+						)
+					except Exception as e:
+						self.logger.warning(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Browser highlighting failed: {e}')
 
-			# Ensure we have valid content
-			if not content:
-				content = SerializedDOMState(_root=None, selector_map={})
+				# Ensure we have valid content
+				if not content:
+					content = SerializedDOMState(_root=None, selector_map={})
 
-			# Tabs info already fetched at the beginning
+				# Tabs info already fetched at the beginning
 
-			# Get target title safely
-			try:
-				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page title...')
-				title = await asyncio.wait_for(self.browser_session.get_current_page_title(), timeout=1.0)
-				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got title: {title}')
-			except Exception as e:
-				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get title: {e}')
-				title = 'Page'
+				# Get target title safely
+				try:
+					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page title...')
+					title = await asyncio.wait_for(self.browser_session.get_current_page_title(), timeout=1.0)
+					self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got title: {title}')
+				except Exception as e:
+					self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get title: {e}')
+					title = 'Page'
 
-			# Get comprehensive page info from CDP with timeout
-			try:
-				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page info from CDP...')
-				page_info = await asyncio.wait_for(self._get_page_info(), timeout=1.0)
+				# Collect comprehensive page info from CDP (started in parallel above), waiting at most 1s more for it here;
+				# since it was started before the DOM build, screenshot and highlights, its effective budget is those plus 1s
+				try:
+					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page info from CDP...')
+					page_info = await asyncio.wait_for(page_info_task, timeout=1.0)
+				except TimeoutError:
+					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Timed out getting page info from CDP')
+					page_info = None
+			finally:
+				# Never leave the page info fetch running if anything above raised before it was awaited
+				if not page_info_task.done():
+					page_info_task.cancel()
+
+			if page_info is not None:
 				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got page info from CDP: {page_info}')
-			except Exception as e:
-				self.logger.debug(
-					f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get page info from CDP: {e}, using fallback'
-				)
+			else:
+				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: No page info from CDP, using fallback')
 				# Fallback to default viewport dimensions
 				viewport = self.browser_session.browser_profile.viewport or {'width': 1280, 'height': 720}
 				page_info = PageInfo(
@@ -565,92 +588,9 @@ class DOMWatchdog(BaseWatchdog):
 				'🔍 DOMWatchdog._build_dom_tree_without_highlights: ✅ DomService.get_serialized_dom_tree completed'
 			)
 
-			# Build hierarchical timing breakdown as single multi-line string
-			timing_lines = [f'⏱️ Total DOM tree time: {total_time_ms:.2f}ms', '📊 Timing breakdown:']
-
-			# get_all_trees breakdown
-			get_all_trees_ms = timing_info.get('get_all_trees_total_ms', 0)
-			if get_all_trees_ms > 0:
-				timing_lines.append(f'  ├─ get_all_trees: {get_all_trees_ms:.2f}ms')
-				iframe_scroll_ms = timing_info.get('iframe_scroll_detection_ms', 0)
-				cdp_parallel_ms = timing_info.get('cdp_parallel_calls_ms', 0)
-				snapshot_proc_ms = timing_info.get('snapshot_processing_ms', 0)
-				if iframe_scroll_ms > 0.01:
-					timing_lines.append(f'  │  ├─ iframe_scroll_detection: {iframe_scroll_ms:.2f}ms')
-				if cdp_parallel_ms > 0.01:
-					timing_lines.append(f'  │  ├─ cdp_parallel_calls: {cdp_parallel_ms:.2f}ms')
-				if snapshot_proc_ms > 0.01:
-					timing_lines.append(f'  │  └─ snapshot_processing: {snapshot_proc_ms:.2f}ms')
-
-			# build_ax_lookup
-			build_ax_ms = timing_info.get('build_ax_lookup_ms', 0)
-			if build_ax_ms > 0.01:
-				timing_lines.append(f'  ├─ build_ax_lookup: {build_ax_ms:.2f}ms')
-
-			# build_snapshot_lookup
-			build_snapshot_ms = timing_info.get('build_snapshot_lookup_ms', 0)
-			if build_snapshot_ms > 0.01:
-				timing_lines.append(f'  ├─ build_snapshot_lookup: {build_snapshot_ms:.2f}ms')
-
-			# construct_enhanced_tree
-			construct_tree_ms = timing_info.get('construct_enhanced_tree_ms', 0)
-			if construct_tree_ms > 0.01:
-				timing_lines.append(f'  ├─ construct_enhanced_tree: {construct_tree_ms:.2f}ms')
-
-			# serialize_accessible_elements breakdown
-			serialize_total_ms = timing_info.get('serialize_accessible_elements_total_ms', 0)
-			if serialize_total_ms > 0.01:
-				timing_lines.append(f'  ├─ serialize_accessible_elements: {serialize_total_ms:.2f}ms')
-				create_simp_ms = timing_info.get('create_simplified_tree_ms', 0)
-				paint_order_ms = timing_info.get('calculate_paint_order_ms', 0)
-				optimize_ms = timing_info.get('optimize_tree_ms', 0)
-				bbox_ms = timing_info.get('bbox_filtering_ms', 0)
-				assign_idx_ms = timing_info.get('assign_interactive_indices_ms', 0)
-				clickable_ms = timing_info.get('clickable_detection_time_ms', 0)
-
-				if create_simp_ms > 0.01:
-					timing_lines.append(f'  │  ├─ create_simplified_tree: {create_simp_ms:.2f}ms')
-					if clickable_ms > 0.01:
-						timing_lines.append(f'  │  │  └─ clickable_detection: {clickable_ms:.2f}ms')
-				if paint_order_ms > 0.01:
-					timing_lines.append(f'  │  ├─ calculate_paint_order: {paint_order_ms:.2f}ms')
-				if optimize_ms > 0.01:
-					timing_lines.append(f'  │  ├─ optimize_tree: {optimize_ms:.2f}ms')
-				if bbox_ms > 0.01:
-					timing_lines.append(f'  │  ├─ bbox_filtering: {bbox_ms:.2f}ms')
-				if assign_idx_ms > 0.01:
-					timing_lines.append(f'  │  └─ assign_interactive_indices: {assign_idx_ms:.2f}ms')
-
-			# Overheads
-			get_dom_overhead_ms = timing_info.get('get_dom_tree_overhead_ms', 0)
-			serialize_overhead_ms = timing_info.get('serialization_overhead_ms', 0)
-			get_serialized_overhead_ms = timing_info.get('get_serialized_dom_tree_overhead_ms', 0)
-
-			if get_dom_overhead_ms > 0.1:
-				timing_lines.append(f'  ├─ get_dom_tree_overhead: {get_dom_overhead_ms:.2f}ms')
-			if serialize_overhead_ms > 0.1:
-				timing_lines.append(f'  ├─ serialization_overhead: {serialize_overhead_ms:.2f}ms')
-			if get_serialized_overhead_ms > 0.1:
-				timing_lines.append(f'  └─ get_serialized_dom_tree_overhead: {get_serialized_overhead_ms:.2f}ms')
-
-			# Calculate total tracked time for validation
-			main_operations_ms = (
-				get_all_trees_ms
-				+ build_ax_ms
-				+ build_snapshot_ms
-				+ construct_tree_ms
-				+ serialize_total_ms
-				+ get_dom_overhead_ms
-				+ serialize_overhead_ms
-				+ get_serialized_overhead_ms
-			)
-			untracked_time_ms = total_time_ms - main_operations_ms
-
-			if untracked_time_ms > 1.0:  # Only log if significant
-				timing_lines.append(f'  ⚠️  untracked_time: {untracked_time_ms:.2f}ms')
-
-			# Single log call with all timing info
-			self.logger.debug('\n'.join(timing_lines))
+			# The breakdown is a few dozen dict lookups and f-strings, only worth building when it will be logged
+			if self.logger.isEnabledFor(logging.DEBUG):
+				self._log_dom_timing_breakdown(total_time_ms, timing_info)
 
 			# Update selector map for other watchdogs
 			self.logger.debug('🔍 DOMWatchdog._build_dom_tree_without_highlights: Updating selector maps...')
@@ -676,6 +616,95 @@ class DOMWatchdog(BaseWatchdog):
 			)
 			raise
 
+	def _log_dom_timing_breakdown(self, total_time_ms: float, timing_info: dict[str, float]) -> None:
+		"""Log the hierarchical DOM build timing breakdown as a single multi-line debug message."""
+		# Build hierarchical timing breakdown as single multi-line string
+		timing_lines = [f'⏱️ Total DOM tree time: {total_time_ms:.2f}ms', '📊 Timing breakdown:']
+
+		# get_all_trees breakdown
+		get_all_trees_ms = timing_info.get('get_all_trees_total_ms', 0)
+		if get_all_trees_ms > 0:
+			timing_lines.append(f'  ├─ get_all_trees: {get_all_trees_ms:.2f}ms')
+			iframe_scroll_ms = timing_info.get('iframe_scroll_detection_ms', 0)
+			cdp_parallel_ms = timing_info.get('cdp_parallel_calls_ms', 0)
+			snapshot_proc_ms = timing_info.get('snapshot_processing_ms', 0)
+			if iframe_scroll_ms > 0.01:
+				timing_lines.append(f'  │  ├─ iframe_scroll_detection: {iframe_scroll_ms:.2f}ms')
+			if cdp_parallel_ms > 0.01:
+				timing_lines.append(f'  │  ├─ cdp_parallel_calls: {cdp_parallel_ms:.2f}ms')
+			if snapshot_proc_ms > 0.01:
+				timing_lines.append(f'  │  └─ snapshot_processing: {snapshot_proc_ms:.2f}ms')
+
+		# build_ax_lookup
+		build_ax_ms = timing_info.get('build_ax_lookup_ms', 0)
+		if build_ax_ms > 0.01:
+			timing_lines.append(f'  ├─ build_ax_lookup: {build_ax_ms:.2f}ms')
+
+		# build_snapshot_lookup
+		build_snapshot_ms = timing_info.get('build_snapshot_lookup_ms', 0)
+		if build_snapshot_ms > 0.01:
+			timing_lines.append(f'  ├─ build_snapshot_lookup: {build_snapshot_ms:.2f}ms')
+
+		# construct_enhanced_tree
+		construct_tree_ms = timing_info.get('construct_enhanced_tree_ms', 0)
+		if construct_tree_ms > 0.01:
+			timing_lines.append(f'  ├─ construct_enhanced_tree: {construct_tree_ms:.2f}ms')
+
+		# serialize_accessible_elements breakdown
+		serialize_total_ms = timing_info.get('serialize_accessible_elements_total_ms', 0)
+		if serialize_total_ms > 0.01:
+			timing_lines.append(f'  ├─ serialize_accessible_elements: {serialize_total_ms:.2f}ms')
+			create_simp_ms = timing_info.get('create_simplified_tree_ms', 0)
+			paint_order_ms = timing_info.get('calculate_paint_order_ms', 0)
+			optimize_ms = timing_info.get('optimize_tree_ms', 0)
+			bbox_ms = timing_info.get('bbox_filtering_ms', 0)
+			assign_idx_ms = timing_info.get('assign_interactive_indices_ms', 0)
+			clickable_ms = timing_info.get('clickable_detection_time_ms', 0)
+
+			if create_simp_ms > 0.01:
+				timing_lines.append(f'  │  ├─ create_simplified_tree: {create_simp_ms:.2f}ms')
+				if clickable_ms > 0.01:
+					timing_lines.append(f'  │  │  └─ clickable_detection: {clickable_ms:.2f}ms')
+			if paint_order_ms > 0.01:
+				timing_lines.append(f'  │  ├─ calculate_paint_order: {paint_order_ms:.2f}ms')
+			if optimize_ms > 0.01:
+				timing_lines.append(f'  │  ├─ optimize_tree: {optimize_ms:.2f}ms')
+			if bbox_ms > 0.01:
+				timing_lines.append(f'  │  ├─ bbox_filtering: {bbox_ms:.2f}ms')
+			if assign_idx_ms > 0.01:
+				timing_lines.append(f'  │  └─ assign_interactive_indices: {assign_idx_ms:.2f}ms')
+
+		# Overheads
+		get_dom_overhead_ms = timing_info.get('get_dom_tree_overhead_ms', 0)
+		serialize_overhead_ms = timing_info.get('serialization_overhead_ms', 0)
+		get_serialized_overhead_ms = timing_info.get('get_serialized_dom_tree_overhead_ms', 0)
+
+		if get_dom_overhead_ms > 0.1:
+			timing_lines.append(f'  ├─ get_dom_tree_overhead: {get_dom_overhead_ms:.2f}ms')
+		if serialize_overhead_ms > 0.1:
+			timing_lines.append(f'  ├─ serialization_overhead: {serialize_overhead_ms:.2f}ms')
+		if get_serialized_overhead_ms > 0.1:
+			timing_lines.append(f'  └─ get_serialized_dom_tree_overhead: {get_serialized_overhead_ms:.2f}ms')
+
+		# Calculate total tracked time for validation
+		main_operations_ms = (
+			get_all_trees_ms
+			+ build_ax_ms
+			+ build_snapshot_ms
+			+ construct_tree_ms
+			+ serialize_total_ms
+			+ get_dom_overhead_ms
+			+ serialize_overhead_ms
+			+ get_serialized_overhead_ms
+		)
+		untracked_time_ms = total_time_ms - main_operations_ms
+
+		if untracked_time_ms > 1.0:  # Only log if significant
+			timing_lines.append(f'  ⚠️  untracked_time: {untracked_time_ms:.2f}ms')
+
+		# Single log call with all timing info
+		self.logger.debug('\n'.join(timing_lines))
+
 	@time_execution_async('capture_clean_screenshot')
 	@observe_debug(ignore_input=True, ignore_output=True, name='capture_clean_screenshot')
 	async def _capture_clean_screenshot(self) -> str:
@@ -745,6 +774,14 @@ class DOMWatchdog(BaseWatchdog):
 
 		return pagination_buttons_data
 
+	async def _get_page_info_or_none(self) -> 'PageInfo | None':
+		"""Get page info, returning None instead of raising so it can run as a background task."""
+		try:
+			return await self._get_page_info()
+		except Exception as e:
+			self.logger.debug(f'Failed to get page info from CDP: {e}')
+			return None
+
 	async def _get_page_info(self) -> 'PageInfo':
 		"""Get comprehensive page information using a single CDP call.
 
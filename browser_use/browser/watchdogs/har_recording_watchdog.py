@@ -29,7 +29,7 @@ from browser_use.browser.events import BrowserConnectedEvent, BrowserStopEvent
 from browser_use.browser.watchdog_base import BaseWatchdog
 
 
-@dataclass
+@dataclass(slots=True)
 class _HarContent:
 	mime_type: str | None = None
 	text_b64: str | None = None  # for embed
@@ -37,7 +37,7 @@ class _HarContent:
 	size: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class _HarEntryBuilder:
 	request_id: str = ''
 	frame_id: str | None = None
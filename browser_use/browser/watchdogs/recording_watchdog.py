@@ -172,5 +172,4 @@ class RecordingWatchdog(BaseWatchdog):
 			self._screencast_params = None
 
 			self.logger.debug('Stopping video recording and saving file...')
-			loop = asyncio.get_event_loop()
-			await loop.run_in_executor(None, recorder.stop_and_save)
+			await asyncio.to_thread(recorder.stop_and_save)
@@ -1,6 +1,9 @@
 """Security watchdog for enforcing URL access policies."""
 
+import fnmatch
+import ipaddress
 from typing import TYPE_CHECKING, ClassVar
+from urllib.parse import urlparse
 
 from bubus import BaseEvent
 
@@ -144,8 +147,6 @@ class SecurityWatchdog(BaseWatchdog):
 		Returns:
 			True if the host is an IP address, False otherwise
 		"""
-		import ipaddress
-
 		try:
 			# Try to parse as IP address (handles both IPv4 and IPv6)
 			ipaddress.ip_address(host)
@@ -170,8 +171,6 @@ class SecurityWatchdog(BaseWatchdog):
 			return True
 
 		# Parse the URL to extract components
-		from urllib.parse import urlparse
-
 		try:
 			parsed = urlparse(url)
 		except Exception:
@@ -240,7 +239,6 @@ class SecurityWatchdog(BaseWatchdog):
 		# Handle glob patterns
 		if '*' in pattern:
 			self._log_glob_warning()
-			import fnmatch
 
 			# Check if pattern matches the host
 			if pattern.startswith('*.'):
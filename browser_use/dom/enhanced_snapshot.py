@@ -5,6 +5,8 @@ This module provides stateless functions for parsing Chrome DevTools Protocol (C
 to extract visibility, clickability, cursor styles, and other layout information.
 """
 
+from operator import itemgetter
+
 from cdp_use.cdp.domsnapshot.commands import CaptureSnapshotReturns
 from cdp_use.cdp.domsnapshot.types import (
 	LayoutTreeSnapshot,
@@ -28,6 +30,26 @@ REQUIRED_COMPUTED_STYLES = [
 	'background-color',  # Used for visibility logic
 ]
 
+# CDP rects are flat [x, y, width, height] lists: unpack all four in one C call instead of four subscripts
+_rect_components = itemgetter(0, 1, 2, 3)
+
+# Nodes without a layout tree entry (text in hidden subtrees, <head> content, etc.) only differ by is_clickable,
+# so they share one of these instead of allocating an identical EnhancedSnapshotNode each.
+# They carry no DOMRect or styles dict, so nothing downstream can mutate them.
+_NO_LAYOUT_SNAPSHOT_NODES: dict[bool | None, EnhancedSnapshotNode] = {
+	is_clickable: EnhancedSnapshotNode(
+		is_clickable=is_clickable,
+		cursor_style=None,
+		bounds=None,
+		clientRects=None,
+		scrollRects=None,
+		computed_styles=None,
+		paint_order=None,
+		stacking_contexts=None,
+	)
+	for is_clickable in (None, True, False)
+}
+
 
 def _parse_rare_boolean_data(rare_data_set: set[int], index: int) -> bool | None:
 	"""Parse rare boolean data from snapshot - returns True if index is in the rare data set."""
@@ -52,6 +74,8 @@ def build_snapshot_lookup(
 
 	logger = logging.getLogger('browser_use.dom.enhanced_snapshot')
 	snapshot_lookup: dict[int, EnhancedSnapshotNode] = {}
+	# Running count of laid-out nodes for the summary log, instead of rescanning the lookup at the end
+	with_bounds = 0
 
 	if not snapshot['documents']:
 		return snapshot_lookup
@@ -77,12 +101,12 @@ def build_snapshot_lookup(
 		)
 
 		# PERFORMANCE: Pre-build layout index map to eliminate O(n²) double lookups
-		# Preserve original behavior: use FIRST occurrence for duplicates
-		layout_index_map = {}
-		if layout and 'nodeIndex' in layout:
-			for layout_idx, node_index in enumerate(layout['nodeIndex']):
-				if node_index not in layout_index_map:  # Only store first occurrence
-					layout_index_map[node_index] = layout_idx
+		# Snapshot node indices are dense integers, so this is a flat list indexed by node index (-1 = no layout)
+		# rather than a dict keyed by int. Preserve original behavior: use FIRST occurrence for duplicates
+		layout_node_indices = layout['nodeIndex'] if layout and 'nodeIndex' in layout else []
+		layout_index_map = [-1] * max(len(nodes.get('backendNodeId', [])), max(layout_node_indices, default=-1) + 1)
+		for layout_idx in range(len(layout_node_indices) - 1, -1, -1):  # walk backwards so the first occurrence wins
+			layout_index_map[layout_node_indices[layout_idx]] = layout_idx
 
 		# Pre-convert rare boolean data from list to set for O(1) lookups.
 		# The raw CDP data uses List[int] which makes `index in list` O(n).
@@ -91,12 +115,32 @@ def build_snapshot_lookup(
 		has_clickable_data = 'isClickable' in nodes
 		is_clickable_set: set[int] = set(nodes['isClickable']['index']) if has_clickable_data else set()
 
+		# The layout tree is already columnar (one array per field, indexed by layout_idx), so resolve each
+		# column and its length once per document instead of re-fetching it from the layout dict per node
+		bounds_column = layout.get('bounds', [])
+		styles_column = layout.get('styles', [])
+		paint_orders_column = layout.get('paintOrders', [])
+		client_rects_column = layout.get('clientRects', [])
+		scroll_rects_column = layout.get('scrollRects', [])
+		num_bounds = len(bounds_column)
+		num_styles = len(styles_column)
+		num_paint_orders = len(paint_orders_column)
+		num_client_rects = len(client_rects_column)
+		num_scroll_rects = len(scroll_rects_column)
+		num_stacking_contexts = len(layout.get('stackingContexts', []))
+		stacking_contexts_index = layout.get('stackingContexts', {}).get('index', [])
+
 		# Build snapshot lookup for each backend node id
 		for backend_node_id, snapshot_index in backend_node_to_snapshot_index.items():
 			is_clickable = None
 			if has_clickable_data:
 				is_clickable = _parse_rare_boolean_data(is_clickable_set, snapshot_index)
 
+			layout_idx = layout_index_map[snapshot_index]
+			if layout_idx < 0:
+				snapshot_lookup[backend_node_id] = _NO_LAYOUT_SNAPSHOT_NODES[is_clickable]
+				continue
+
 			# Find corresponding layout node
 			cursor_style = None
 			is_visible = None
@@ -108,61 +152,50 @@ def build_snapshot_lookup(
 			client_rects = None
 			scroll_rects = None
 			stacking_contexts = None
-			if snapshot_index in layout_index_map:
-				layout_idx = layout_index_map[snapshot_index]
-				if layout_idx < len(layout.get('bounds', [])):
-					# Parse bounding box
-					bounds = layout['bounds'][layout_idx]
-					if len(bounds) >= 4:
-						# IMPORTANT: CDP coordinates are in device pixels, convert to CSS pixels
-						# by dividing by the device pixel ratio
-						raw_x, raw_y, raw_width, raw_height = bounds[0], bounds[1], bounds[2], bounds[3]
-
-						# Apply device pixel ratio scaling to convert device pixels to CSS pixels
-						bounding_box = DOMRect(
-							x=raw_x / device_pixel_ratio,
-							y=raw_y / device_pixel_ratio,
-							width=raw_width / device_pixel_ratio,
-							height=raw_height / device_pixel_ratio,
-						)
-
-					# Parse computed styles for this layout node
-					if layout_idx < len(layout.get('styles', [])):
-						style_indices = layout['styles'][layout_idx]
-						computed_styles = _parse_computed_styles(strings, style_indices)
-						cursor_style = computed_styles.get('cursor')
-
-					# Extract paint order if available
-					if layout_idx < len(layout.get('paintOrders', [])):
-						paint_order = layout.get('paintOrders', [])[layout_idx]
-
-					# Extract client rects if available
-					client_rects_data = layout.get('clientRects', [])
-					if layout_idx < len(client_rects_data):
-						client_rect_data = client_rects_data[layout_idx]
-						if client_rect_data and len(client_rect_data) >= 4:
-							client_rects = DOMRect(
-								x=client_rect_data[0],
-								y=client_rect_data[1],
-								width=client_rect_data[2],
-								height=client_rect_data[3],
-							)
-
-					# Extract scroll rects if available
-					scroll_rects_data = layout.get('scrollRects', [])
-					if layout_idx < len(scroll_rects_data):
-						scroll_rect_data = scroll_rects_data[layout_idx]
-						if scroll_rect_data and len(scroll_rect_data) >= 4:
-							scroll_rects = DOMRect(
-								x=scroll_rect_data[0],
-								y=scroll_rect_data[1],
-								width=scroll_rect_data[2],
-								height=scroll_rect_data[3],
-							)
-
-					# Extract stacking contexts if available
-					if layout_idx < len(layout.get('stackingContexts', [])):
-						stacking_contexts = layout.get('stackingContexts', {}).get('index', [])[layout_idx]
+			if layout_idx < num_bounds:
+				# Parse bounding box
+				bounds = bounds_column[layout_idx]
+				if len(bounds) >= 4:
+					# IMPORTANT: CDP coordinates are in device pixels, convert to CSS pixels
+					# by dividing by the device pixel ratio
+					raw_x, raw_y, raw_width, raw_height = _rect_components(bounds)
+
+					# Apply device pixel ratio scaling to convert device pixels to CSS pixels
+					bounding_box = DOMRect(
+						x=raw_x / device_pixel_ratio,
+						y=raw_y / device_pixel_ratio,
+						width=raw_width / device_pixel_ratio,
+						height=raw_height / device_pixel_ratio,
+					)
+					with_bounds += 1
+
+				# Parse computed styles for this layout node
+				if layout_idx < num_styles:
+					style_indices = styles_column[layout_idx]
+					computed_styles = _parse_computed_styles(strings, style_indices)
+					cursor_style = computed_styles.get('cursor')
+
+				# Extract paint order if available
+				if layout_idx < num_paint_orders:
+					paint_order = paint_orders_column[layout_idx]
+
+				# Extract client rects if available
+				if layout_idx < num_client_rects:
+					client_rect_data = client_rects_column[layout_idx]
+					if client_rect_data and len(client_rect_data) >= 4:
+						rect_x, rect_y, rect_width, rect_height = _rect_components(client_rect_data)
+						client_rects = DOMRect(x=rect_x, y=rect_y, width=rect_width, height=rect_height)
+
+				# Extract scroll rects if available
+				if layout_idx < num_scroll_rects:
+					scroll_rect_data = scroll_rects_column[layout_idx]
+					if scroll_rect_data and len(scroll_rect_data) >= 4:
+						rect_x, rect_y, rect_width, rect_height = _rect_components(scroll_rect_data)
+						scroll_rects = DOMRect(x=rect_x, y=rect_y, width=rect_width, height=rect_height)
+
+				# Extract stacking contexts if available
+				if layout_idx < num_stacking_contexts:
+					stacking_contexts = stacking_contexts_index[layout_idx]
 
 			snapshot_lookup[backend_node_id] = EnhancedSnapshotNode(
 				is_clickable=is_clickable,
@@ -176,6 +209,5 @@ def build_snapshot_lookup(
 			)
 
 	# Count how many have bounds (are actually visible/laid out)
-	with_bounds = sum(1 for n in snapshot_lookup.values() if n.bounds)
 	logger.debug(f'🔍 SNAPSHOT: Built lookup with {len(snapshot_lookup)} total entries, {with_bounds} have bounds')
 	return snapshot_lookup
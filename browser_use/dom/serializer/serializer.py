@@ -1,5 +1,6 @@
 # @file purpose: Serializes enhanced DOM trees to string format for LLM consumption
 
+import time
 from typing import Any
 
 from browser_use.dom.serializer.clickable_elements import ClickableElementDetector
@@ -37,6 +38,20 @@ SVG_ELEMENTS = {
 	'tspan',
 }
 
+# Attribute lookup tables for _build_attributes_string, built once instead of per serialized node
+DATE_TIME_INPUT_FORMATS = {
+	'date': 'YYYY-MM-DD',
+	'time': 'HH:MM',
+	'datetime-local': 'YYYY-MM-DDTHH:MM',
+	'month': 'YYYY-MM',
+	'week': 'YYYY-W##',
+}
+DATEPICKER_CLASS_INDICATORS = ('datepicker', 'datetimepicker', 'daterangepicker')
+# Properties that carry field values - must be excluded for password fields
+VALUE_PROPERTIES = frozenset({'value', 'valuetext'})
+# Attributes that should never be removed as duplicates (they serve distinct purposes)
+PROTECTED_ATTRIBUTES = frozenset({'format', 'expected_format', 'placeholder', 'value', 'aria-label', 'title'})
+
 
 class DOMTreeSerializer:
 	"""Serializes enhanced DOM trees to string format."""
@@ -69,6 +84,8 @@ class DOMTreeSerializer:
 		self._interactive_counter = 1
 		self._selector_map: DOMSelectorMap = {}
 		self._previous_cached_selector_map = previous_cached_state.selector_map if previous_cached_state else None
+		# backend_node_ids of the previous selector map, built lazily on the first is_new check (see _is_new_backend_node_id)
+		self._previous_backend_node_ids: set[int] | None = None
 		# Add timing tracking
 		self.timing_info: dict[str, float] = {}
 		# Cache for clickable element detection to avoid redundant calls
@@ -98,9 +115,7 @@ class DOMTreeSerializer:
 			return None
 
 	def serialize_accessible_elements(self) -> tuple[SerializedDOMState, dict[str, float]]:
-		import time
-
-		start_total = time.time()
+		start_total = time.perf_counter()
 
 		# Reset state
 		self._interactive_counter = 1
@@ -109,40 +124,40 @@ class DOMTreeSerializer:
 		self._clickable_cache = {}  # Clear cache for new serialization
 
 		# Step 1: Create simplified tree (includes clickable element detection)
-		start_step1 = time.time()
+		start_step1 = time.perf_counter()
 		simplified_tree = self._create_simplified_tree(self.root_node)
-		end_step1 = time.time()
+		end_step1 = time.perf_counter()
 		self.timing_info['create_simplified_tree'] = end_step1 - start_step1
 
 		# Step 2: Remove elements based on paint order
-		start_step3 = time.time()
+		start_step3 = time.perf_counter()
 		if self.paint_order_filtering and simplified_tree:
 			PaintOrderRemover(simplified_tree).calculate_paint_order()
-		end_step3 = time.time()
+		end_step3 = time.perf_counter()
 		self.timing_info['calculate_paint_order'] = end_step3 - start_step3
 
 		# Step 3: Optimize tree (remove unnecessary parents)
-		start_step2 = time.time()
+		start_step2 = time.perf_counter()
 		optimized_tree = self._optimize_tree(simplified_tree)
-		end_step2 = time.time()
+		end_step2 = time.perf_counter()
 		self.timing_info['optimize_tree'] = end_step2 - start_step2
 
 		# Step 3: Apply bounding box filtering (NEW)
 		if self.enable_bbox_filtering and optimized_tree:
-			start_step3 = time.time()
+			start_step3 = time.perf_counter()
 			filtered_tree = self._apply_bounding_box_filtering(optimized_tree)
-			end_step3 = time.time()
+			end_step3 = time.perf_counter()
 			self.timing_info['bbox_filtering'] = end_step3 - start_step3
 		else:
 			filtered_tree = optimized_tree
 
 		# Step 4: Assign interactive indices to clickable elements
-		start_step4 = time.time()
+		start_step4 = time.perf_counter()
 		self._assign_interactive_indices_and_mark_new_nodes(filtered_tree)
-		end_step4 = time.time()
+		end_step4 = time.perf_counter()
 		self.timing_info['assign_interactive_indices'] = end_step4 - start_step4
 
-		end_total = time.time()
+		end_total = time.perf_counter()
 		self.timing_info['serialize_accessible_elements_total'] = end_total - start_total
 
 		return SerializedDOMState(_root=filtered_tree, selector_map=self._selector_map), self.timing_info
@@ -418,11 +433,9 @@ class DOMTreeSerializer:
 		"""Cached version of clickable element detection to avoid redundant calls."""
 
 		if node.node_id not in self._clickable_cache:
-			import time
-
-			start_time = time.time()
+			start_time = time.perf_counter()
 			result = ClickableElementDetector.is_interactive(node)
-			end_time = time.time()
+			end_time = time.perf_counter()
 
 			if 'clickable_detection_time' not in self.timing_info:
 				self.timing_info['clickable_detection_time'] = 0
@@ -458,11 +471,12 @@ class DOMTreeSerializer:
 
 		elif node.node_type == NodeType.ELEMENT_NODE:
 			# Skip non-content elements
-			if node.node_name.lower() in DISABLED_ELEMENTS:
+			tag_name = node.tag_name
+			if tag_name in DISABLED_ELEMENTS:
 				return None
 
 			# Skip SVG child elements entirely (path, rect, g, circle, etc.)
-			if node.node_name.lower() in SVG_ELEMENTS:
+			if tag_name in SVG_ELEMENTS:
 				return None
 
 			attributes = node.attributes or {}
@@ -491,10 +505,12 @@ class DOMTreeSerializer:
 
 			is_visible = node.is_visible
 			is_scrollable = node.is_actually_scrollable
-			has_shadow_content = bool(node.children_and_shadow_roots)
+			# children_and_shadow_roots copies the child list on every access, so take it once for all three uses below
+			children_and_shadow_roots = node.children_and_shadow_roots
+			has_shadow_content = bool(children_and_shadow_roots)
 
 			# ENHANCED SHADOW DOM DETECTION: Include shadow hosts even if not visible
-			is_shadow_host = any(child.node_type == NodeType.DOCUMENT_FRAGMENT_NODE for child in node.children_and_shadow_roots)
+			is_shadow_host = any(child.node_type == NodeType.DOCUMENT_FRAGMENT_NODE for child in children_and_shadow_roots)
 
 			# Override visibility for elements with validation attributes
 			if not is_visible and node.attributes:
@@ -504,9 +520,7 @@ class DOMTreeSerializer:
 
 			# EXCEPTION: File inputs are often hidden with opacity:0 but are still functional
 			# Bootstrap and other frameworks use this pattern with custom-styled file pickers
-			is_file_input = (
-				node.tag_name and node.tag_name.lower() == 'input' and node.attributes and node.attributes.get('type') == 'file'
-			)
+			is_file_input = tag_name == 'input' and node.attributes and node.attributes.get('type') == 'file'
 			if not is_visible and is_file_input:
 				is_visible = True  # Force visibility for file inputs
 
@@ -515,10 +529,13 @@ class DOMTreeSerializer:
 				simplified = SimplifiedNode(original_node=node, children=[], is_shadow_host=is_shadow_host)
 
 				# Process ALL children including shadow roots with enhanced logging
-				for child in node.children_and_shadow_roots:
-					simplified_child = self._create_simplified_tree(child, depth + 1)
+				create_simplified_tree = self._create_simplified_tree
+				append_child = simplified.children.append
+				child_depth = depth + 1
+				for child in children_and_shadow_roots:
+					simplified_child = create_simplified_tree(child, child_depth)
 					if simplified_child:
-						simplified.children.append(simplified_child)
+						append_child(simplified_child)
 
 				# COMPOUND CONTROL PROCESSING: Add virtual components for compound controls
 				self._add_compound_components(simplified, node)
@@ -626,14 +643,18 @@ class DOMTreeSerializer:
 			is_visible = node.original_node.snapshot_node and node.original_node.is_visible
 			is_scrollable = node.original_node.is_actually_scrollable
 
+			# Walk the parent chain for shadow-root membership at most once per node: both the diagnostic below
+			# and the shadow DOM exception need it, and only for interactive nodes without snapshot data
+			missing_snapshot = is_interactive_assign and not node.original_node.snapshot_node
+			in_shadow = missing_snapshot and self._is_inside_shadow_dom(node)
+
 			# DIAGNOSTIC: Log when interactive elements don't have snapshot_node
-			if is_interactive_assign and not node.original_node.snapshot_node:
+			if missing_snapshot:
 				import logging
 
 				logger = logging.getLogger('browser_use.dom.serializer')
 				attrs = node.original_node.attributes or {}
 				attr_str = f'name={attrs.get("name", "")} id={attrs.get("id", "")} type={attrs.get("type", "")}'
-				in_shadow = self._is_inside_shadow_dom(node)
 				if (
 					in_shadow
 					and node.original_node.tag_name
@@ -662,11 +683,9 @@ class DOMTreeSerializer:
 			# DOMSnapshot.captureSnapshot, but they're still functional/interactive.
 			# This handles login forms, custom web components, etc. inside shadow DOM.
 			is_shadow_dom_element = (
-				is_interactive_assign
-				and not node.original_node.snapshot_node
+				in_shadow
 				and node.original_node.tag_name
 				and node.original_node.tag_name.lower() in ['input', 'button', 'select', 'textarea', 'a']
-				and self._is_inside_shadow_dom(node)
 			)
 
 			# Check if scrollable container should be made interactive
@@ -718,14 +737,22 @@ class DOMTreeSerializer:
 					node.is_new = True
 				elif self._previous_cached_selector_map:
 					# Check if node is new for regular elements
-					previous_backend_node_ids = {node.backend_node_id for node in self._previous_cached_selector_map.values()}
-					if node.original_node.backend_node_id not in previous_backend_node_ids:
+					if self._is_new_backend_node_id(node.original_node.backend_node_id):
 						node.is_new = True
 
 		# Process children
 		for child in node.children:
 			self._assign_interactive_indices_and_mark_new_nodes(child)
 
+	def _is_new_backend_node_id(self, backend_node_id: int) -> bool:
+		"""Check whether an element was absent from the previous step's selector map."""
+		# The set is built on first use and reused for every later interactive element, instead of being
+		# rebuilt per element (which made index assignment O(interactive elements x previous selector map))
+		if self._previous_backend_node_ids is None:
+			previous_selector_map = self._previous_cached_selector_map or {}
+			self._previous_backend_node_ids = {node.backend_node_id for node in previous_selector_map.values()}
+		return backend_node_id not in self._previous_backend_node_ids
+
 	def _apply_bounding_box_filtering(self, node: SimplifiedNode | None) -> SimplifiedNode | None:
 		"""Filter children contained within propagating parent bounds."""
 		if not node:
@@ -880,16 +907,27 @@ class DOMTreeSerializer:
 		return False
 
 	@staticmethod
-	def serialize_tree(node: SimplifiedNode | None, include_attributes: list[str], depth: int = 0) -> str:
-		"""Serialize the optimized tree to string format."""
+	def serialize_tree(
+		node: SimplifiedNode | None,
+		include_attributes: list[str],
+		depth: int = 0,
+		include_attributes_set: frozenset[str] | None = None,
+	) -> str:
+		"""Serialize the optimized tree to string format.
+
+		include_attributes_set is the frozenset of include_attributes, built once at the top-level call and passed down.
+		"""
 		if not node:
 			return ''
 
+		if include_attributes_set is None:
+			include_attributes_set = frozenset(include_attributes)
+
 		# Skip rendering excluded nodes, but process their children
 		if hasattr(node, 'excluded_by_parent') and node.excluded_by_parent:
 			formatted_text = []
 			for child in node.children:
-				child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, depth)
+				child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, depth, include_attributes_set)
 				if child_text:
 					formatted_text.append(child_text)
 			return '\n'.join(formatted_text)
@@ -902,7 +940,7 @@ class DOMTreeSerializer:
 			# Skip displaying nodes marked as should_display=False
 			if not node.should_display:
 				for child in node.children:
-					child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, depth)
+					child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, depth, include_attributes_set)
 					if child_text:
 						formatted_text.append(child_text)
 				return '\n'.join(formatted_text)
@@ -925,7 +963,9 @@ class DOMTreeSerializer:
 					new_prefix = '*' if node.is_new else ''
 					line += f'{new_prefix}[{node.original_node.backend_node_id}]'
 				line += '<svg'
-				attributes_html_str = DOMTreeSerializer._build_attributes_string(node.original_node, include_attributes, '')
+				attributes_html_str = DOMTreeSerializer._build_attributes_string(
+					node.original_node, include_attributes, '', include_attributes_set
+				)
 				if attributes_html_str:
 					line += f' {attributes_html_str}'
 				line += ' /> <!-- SVG content collapsed -->'
@@ -947,7 +987,7 @@ class DOMTreeSerializer:
 				# Build attributes string with compound component info
 				text_content = ''
 				attributes_html_str = DOMTreeSerializer._build_attributes_string(
-					node.original_node, include_attributes, text_content
+					node.original_node, include_attributes, text_content, include_attributes_set
 				)
 
 				# Add compound component information to attributes if present
@@ -1038,7 +1078,7 @@ class DOMTreeSerializer:
 
 			# Process shadow DOM children
 			for child in node.children:
-				child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, next_depth)
+				child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, next_depth, include_attributes_set)
 				if child_text:
 					formatted_text.append(child_text)
 
@@ -1061,7 +1101,7 @@ class DOMTreeSerializer:
 		# Process children (for non-shadow elements)
 		if node.original_node.node_type != NodeType.DOCUMENT_FRAGMENT_NODE:
 			for child in node.children:
-				child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, next_depth)
+				child_text = DOMTreeSerializer.serialize_tree(child, include_attributes, next_depth, include_attributes_set)
 				if child_text:
 					formatted_text.append(child_text)
 
@@ -1085,19 +1125,24 @@ class DOMTreeSerializer:
 		return '\n'.join(formatted_text)
 
 	@staticmethod
-	def _build_attributes_string(node: EnhancedDOMTreeNode, include_attributes: list[str], text: str) -> str:
+	def _build_attributes_string(
+		node: EnhancedDOMTreeNode,
+		include_attributes: list[str],
+		text: str,
+		include_attributes_set: frozenset[str] | None = None,
+	) -> str:
 		"""Build the attributes string for an element."""
 		attributes_to_include = {}
+		if include_attributes_set is None:
+			include_attributes_set = frozenset(include_attributes)
 
-		# Include HTML attributes
+		# Include HTML attributes (strip each value once, then drop empty ones)
 		if node.attributes:
-			attributes_to_include.update(
-				{
-					key: str(value).strip()
-					for key, value in node.attributes.items()
-					if key in include_attributes and str(value).strip() != ''
-				}
-			)
+			attributes_to_include = {
+				key: stripped
+				for key, value in node.attributes.items()
+				if key in include_attributes_set and (stripped := str(value).strip())
+			}
 
 		# Add format hints for date/time inputs to help LLMs use the correct format
 		# NOTE: These formats are standardized by HTML5 specification (ISO 8601), NOT locale-dependent
@@ -1112,20 +1157,13 @@ class DOMTreeSerializer:
 
 			# For HTML5 date/time inputs, add a highly visible "format" attribute
 			# This makes it IMPOSSIBLE for the model to miss the required format
-			if input_type in ['date', 'time', 'datetime-local', 'month', 'week']:
-				format_map = {
-					'date': 'YYYY-MM-DD',
-					'time': 'HH:MM',
-					'datetime-local': 'YYYY-MM-DDTHH:MM',
-					'month': 'YYYY-MM',
-					'week': 'YYYY-W##',
-				}
+			if input_type in DATE_TIME_INPUT_FORMATS:
 				# Add format as a special attribute that appears prominently
 				# This appears BEFORE placeholder in the serialized output
-				attributes_to_include['format'] = format_map[input_type]
+				attributes_to_include['format'] = DATE_TIME_INPUT_FORMATS[input_type]
 
 			# Only add placeholder if it doesn't already exist
-			if 'placeholder' in include_attributes and 'placeholder' not in attributes_to_include:
+			if 'placeholder' in include_attributes_set and 'placeholder' not in attributes_to_include:
 				# Native HTML5 date/time inputs - ISO format required
 				if input_type == 'date':
 					attributes_to_include['placeholder'] = 'YYYY-MM-DD'
@@ -1155,7 +1193,7 @@ class DOMTreeSerializer:
 							# Also keep format for consistency with HTML5 date inputs
 							attributes_to_include['format'] = date_format
 					# Detect jQuery/Bootstrap datepickers by class names
-					elif any(indicator in class_attr for indicator in ['datepicker', 'datetimepicker', 'daterangepicker']):
+					elif any(indicator in class_attr for indicator in DATEPICKER_CLASS_INDICATORS):
 						# Try to get format from data-date-format attribute
 						date_format = node.attributes.get('data-date-format', '')
 						if date_format:
@@ -1186,12 +1224,10 @@ class DOMTreeSerializer:
 
 		# Include accessibility properties
 		if node.ax_node and node.ax_node.properties:
-			# Properties that carry field values - must be excluded for password fields
-			value_properties = {'value', 'valuetext'}
 			for prop in node.ax_node.properties:
 				try:
-					if prop.name in include_attributes and prop.value is not None:
-						if is_password_field and prop.name in value_properties:
+					if prop.name in include_attributes_set and prop.value is not None:
+						if is_password_field and prop.name in VALUE_PROPERTIES:
 							continue
 						# Convert boolean to lowercase string, keep others as-is
 						if isinstance(prop.value, bool):
@@ -1234,13 +1270,10 @@ class DOMTreeSerializer:
 			keys_to_remove = set()
 			seen_values = {}
 
-			# Attributes that should never be removed as duplicates (they serve distinct purposes)
-			protected_attrs = {'format', 'expected_format', 'placeholder', 'value', 'aria-label', 'title'}
-
 			for key in ordered_keys:
 				value = attributes_to_include[key]
 				if len(value) > 5:
-					if value in seen_values and key not in protected_attrs:
+					if value in seen_values and key not in PROTECTED_ATTRIBUTES:
 						keys_to_remove.add(key)
 					else:
 						seen_values[value] = key
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import sys
 import time
 from typing import TYPE_CHECKING, Any
 
@@ -27,7 +28,89 @@ from browser_use.observability import observe_debug
 from browser_use.utils import create_task_with_error_handling
 
 if TYPE_CHECKING:
-	from browser_use.browser.session import BrowserSession
+	from browser_use.browser.session import BrowserSession, CDPSession
+
+# Static CDP evaluation scripts for _get_all_trees(), defined once instead of being rebuilt on every DOM refresh
+_IFRAME_SCROLL_POSITIONS_SCRIPT = """
+(() => {
+	const scrollData = {};
+	const iframes = document.querySelectorAll('iframe');
+	iframes.forEach((iframe, index) => {
+		try {
+			const doc = iframe.contentDocument || iframe.contentWindow.document;
+			if (doc) {
+				scrollData[index] = {
+					scrollTop: doc.documentElement.scrollTop || doc.body.scrollTop || 0,
+					scrollLeft: doc.documentElement.scrollLeft || doc.body.scrollLeft || 0
+				};
+			}
+		} catch (e) {
+			// Cross-origin iframe, can't access
+		}
+	});
+	return scrollData;
+})()
+"""
+
+# Returns element references (not values) so their backend node ids can be resolved via DOM.describeNode
+_CLICK_LISTENER_ELEMENTS_SCRIPT = """
+(() => {
+	// getEventListeners is only available in DevTools context via includeCommandLineAPI
+	if (typeof getEventListeners !== 'function') {
+		return null;
+	}
+
+	// getElementsByTagName('*') skips selector parsing and the static NodeList snapshot of querySelectorAll
+	const allElements = document.getElementsByTagName('*');
+
+	// Skip on heavy pages — listener detection is too expensive
+	if (allElements.length > 10000) {
+		return null;
+	}
+
+	const elementsWithListeners = [];
+
+	for (const el of allElements) {
+		try {
+			const listeners = getEventListeners(el);
+			// Check for click-related event listeners
+			if (listeners.click || listeners.mousedown || listeners.mouseup || listeners.pointerdown || listeners.pointerup) {
+				// Skip elements that are not rendered at all (display:none, hidden subtrees): they are never
+				// visible in the serialized tree, and each returned element costs a DOM.describeNode round-trip.
+				// display:contents boxes have no rects of their own but their children are laid out, so keep them.
+				if (el.getClientRects().length === 0 && getComputedStyle(el).display !== 'contents') {
+					continue;
+				}
+				elementsWithListeners.push(el);
+			}
+		} catch (e) {
+			// Ignore errors for individual elements (e.g., cross-origin)
+		}
+	}
+
+	return elementsWithListeners;
+})()
+"""
+
+# Resolved once at import: NodeType(value) goes through Enum.__call__ on every node, a dict lookup does not
+_NODE_TYPE_BY_VALUE: dict[int, NodeType] = {node_type.value: node_type for node_type in NodeType}
+_ELEMENT_NODE_TYPE = NodeType.ELEMENT_NODE.value
+
+# Shared by every node CDP sent no attributes for (text, comment, document nodes...) instead of a fresh {} each.
+# Node attributes are only ever read or replaced downstream, never mutated in place - keep it that way.
+_EMPTY_ATTRIBUTES: dict[str, str] = {}
+
+# nodeName -> interned upper-cased name. Pages only use a few dozen distinct tag names, so every node after the
+# first of its kind reuses one shared string instead of allocating a fresh .upper() copy
+_NODE_NAME_UPPER: dict[str, str] = {}
+
+
+def _node_name_upper(node_name: str) -> str:
+	upper = _NODE_NAME_UPPER.get(node_name)
+	if upper is None:
+		upper = _NODE_NAME_UPPER[node_name] = sys.intern(node_name.upper())
+	return upper
+
 
 # Note: iframe limits are now configurable via BrowserProfile.max_iframes and BrowserProfile.max_iframe_depth
 
@@ -182,36 +265,43 @@ class DomService:
 		process_node(node)
 
 	def _build_enhanced_ax_node(self, ax_node: AXNode) -> EnhancedAXNode:
-		properties: list[EnhancedAXProperty] | None = None
-		if 'properties' in ax_node and ax_node['properties']:
-			properties = []
-			for property in ax_node['properties']:
-				try:
-					# test whether property name can go into the enum (sometimes Chrome returns some random properties)
-					properties.append(
-						EnhancedAXProperty(
-							name=property['name'],
-							value=property.get('value', {}).get('value', None),
-							# related_nodes=[],  # TODO: add related nodes
-						)
-					)
-				except ValueError:
-					pass
+		# AXPropertyName is a Literal alias, so constructing EnhancedAXProperty never validates (or raises on) the name;
+		# build the list in one comprehension and only look into 'value' when Chrome sent one
+		raw_properties = ax_node.get('properties')
+		properties: list[EnhancedAXProperty] | None = (
+			[
+				EnhancedAXProperty(
+					name=property['name'],
+					value=property_value.get('value', None) if (property_value := property.get('value')) else None,
+					# related_nodes=[],  # TODO: add related nodes
+				)
+				for property in raw_properties
+			]
+			if raw_properties
+			else None
+		)
+
+		# Fetch each optional field once (no throwaway {} defaults, no second childIds lookup)
+		role = ax_node.get('role')
+		name = ax_node.get('name')
+		description = ax_node.get('description')
+		child_ids = ax_node.get('childIds')
 
 		enhanced_ax_node = EnhancedAXNode(
 			ax_node_id=ax_node['nodeId'],
 			ignored=ax_node['ignored'],
-			role=ax_node.get('role', {}).get('value', None),
-			name=ax_node.get('name', {}).get('value', None),
-			description=ax_node.get('description', {}).get('value', None),
+			role=role.get('value', None) if role else None,
+			name=name.get('value', None) if name else None,
+			description=description.get('value', None) if description else None,
 			properties=properties,
-			child_ids=ax_node.get('childIds', []) if ax_node.get('childIds') else None,
+			child_ids=child_ids if child_ids else None,
 		)
 		return enhanced_ax_node
 
-	async def _get_viewport_ratio(self, target_id: TargetID) -> float:
+	async def _get_viewport_ratio(self, target_id: TargetID, cdp_session: 'CDPSession | None' = None) -> float:
 		"""Get viewport dimensions, device pixel ratio, and scroll position using CDP."""
-		cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
+		if cdp_session is None:
+			cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
 
 		try:
 			# Get the layout metrics which includes the visual viewport
@@ -336,10 +426,13 @@ class DomService:
 		# If we reach here, element is visible in main viewport and all containing iframes
 		return True
 
-	async def _get_ax_tree_for_all_frames(self, target_id: TargetID) -> GetFullAXTreeReturns:
+	async def _get_ax_tree_for_all_frames(
+		self, target_id: TargetID, cdp_session: 'CDPSession | None' = None
+	) -> GetFullAXTreeReturns:
 		"""Recursively collect all frames and merge their accessibility trees into a single array."""
 
-		cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
+		if cdp_session is None:
+			cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
 		frame_tree = await cdp_session.cdp_client.send.Page.getFrameTree(session_id=cdp_session.session_id)
 
 		def collect_all_frame_ids(frame_tree_node) -> list[str]:
@@ -376,98 +469,45 @@ class DomService:
 	async def _get_all_trees(self, target_id: TargetID) -> TargetAllTrees:
 		cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
 
-		# Wait for the page to be ready first
-		try:
-			ready_state = await cdp_session.cdp_client.send.Runtime.evaluate(
-				params={'expression': 'document.readyState'}, session_id=cdp_session.session_id
-			)
-		except Exception as e:
-			pass  # Page might not be ready yet
 		# DEBUG: Log before capturing snapshot
 		self.logger.debug(f'🔍 DEBUG: Capturing DOM snapshot for target {target_id}')
 
-		# Get actual scroll positions for all iframes before capturing snapshot
-		start_iframe_scroll = time.time()
+		# Get actual scroll positions for all iframes before capturing snapshot.
+		# The values only feed the debug log below, so skip the whole Runtime.evaluate round-trip
+		# (and the by-value transfer of its result) unless DEBUG logging is on.
+		start_iframe_scroll = time.perf_counter()
 		iframe_scroll_positions = {}
-		try:
-			scroll_result = await cdp_session.cdp_client.send.Runtime.evaluate(
-				params={
-					'expression': """
-					(() => {
-						const scrollData = {};
-						const iframes = document.querySelectorAll('iframe');
-						iframes.forEach((iframe, index) => {
-							try {
-								const doc = iframe.contentDocument || iframe.contentWindow.document;
-								if (doc) {
-									scrollData[index] = {
-										scrollTop: doc.documentElement.scrollTop || doc.body.scrollTop || 0,
-										scrollLeft: doc.documentElement.scrollLeft || doc.body.scrollLeft || 0
-									};
-								}
-							} catch (e) {
-								// Cross-origin iframe, can't access
-							}
-						});
-						return scrollData;
-					})()
-					""",
-					'returnByValue': True,
-				},
-				session_id=cdp_session.session_id,
-			)
-			if scroll_result and 'result' in scroll_result and 'value' in scroll_result['result']:
-				iframe_scroll_positions = scroll_result['result']['value']
-				for idx, scroll_data in iframe_scroll_positions.items():
-					self.logger.debug(
-						f'🔍 DEBUG: Iframe {idx} actual scroll position - scrollTop={scroll_data.get("scrollTop", 0)}, scrollLeft={scroll_data.get("scrollLeft", 0)}'
-					)
-		except Exception as e:
-			self.logger.debug(f'Failed to get iframe scroll positions: {e}')
-		iframe_scroll_ms = (time.time() - start_iframe_scroll) * 1000
+		if self.logger.isEnabledFor(logging.DEBUG):
+			try:
+				scroll_result = await cdp_session.cdp_client.send.Runtime.evaluate(
+					params={
+						'expression': _IFRAME_SCROLL_POSITIONS_SCRIPT,
+						'returnByValue': True,
+					},
+					session_id=cdp_session.session_id,
+				)
+				if scroll_result and 'result' in scroll_result and 'value' in scroll_result['result']:
+					iframe_scroll_positions = scroll_result['result']['value']
+					for idx, scroll_data in iframe_scroll_positions.items():
+						self.logger.debug(
+							f'🔍 DEBUG: Iframe {idx} actual scroll position - scrollTop={scroll_data.get("scrollTop", 0)}, scrollLeft={scroll_data.get("scrollLeft", 0)}'
+						)
+			except Exception as e:
+				self.logger.debug(f'Failed to get iframe scroll positions: {e}')
+		iframe_scroll_ms = (time.perf_counter() - start_iframe_scroll) * 1000
 
 		# Detect elements with JavaScript click event listeners (without mutating DOM)
-		# On heavy pages (>10k elements) the querySelectorAll('*') + getEventListeners()
+		# On heavy pages (>10k elements) the getElementsByTagName('*') + getEventListeners()
 		# loop plus per-element DOM.describeNode CDP calls can take 10s+.
 		# The JS expression below bails out early if the page is too heavy.
 		# Elements are still detected via the accessibility tree and ClickableElementDetector.
-		start_js_listener_detection = time.time()
+		start_js_listener_detection = time.perf_counter()
 		js_click_listener_backend_ids: set[int] = set()
 		try:
 			# Step 1: Run JS to find elements with click listeners and return them by reference
 			js_listener_result = await cdp_session.cdp_client.send.Runtime.evaluate(
 				params={
-					'expression': """
-					(() => {
-						// getEventListeners is only available in DevTools context via includeCommandLineAPI
-						if (typeof getEventListeners !== 'function') {
-							return null;
-						}
-
-						const allElements = document.querySelectorAll('*');
-
-						// Skip on heavy pages — listener detection is too expensive
-						if (allElements.length > 10000) {
-							return null;
-						}
-
-						const elementsWithListeners = [];
-
-						for (const el of allElements) {
-							try {
-								const listeners = getEventListeners(el);
-								// Check for click-related event listeners
-								if (listeners.click || listeners.mousedown || listeners.mouseup || listeners.pointerdown || listeners.pointerup) {
-									elementsWithListeners.push(el);
-								}
-							} catch (e) {
-								// Ignore errors for individual elements (e.g., cross-origin)
-							}
-						}
-
-						return elementsWithListeners;
-					})()
-					""",
+					'expression': _CLICK_LISTENER_ELEMENTS_SCRIPT,
 					'includeCommandLineAPI': True,  # enables getEventListeners()
 					'returnByValue': False,  # Return object references, not values
 				},
@@ -524,7 +564,7 @@ class DomService:
 				self.logger.debug(f'Detected {len(js_click_listener_backend_ids)} elements with JS click listeners')
 		except Exception as e:
 			self.logger.debug(f'Failed to detect JS event listeners: {e}')
-		js_listener_detection_ms = (time.time() - start_js_listener_detection) * 1000
+		js_listener_detection_ms = (time.perf_counter() - start_js_listener_detection) * 1000
 
 		# Define CDP request factories to avoid duplication
 		def create_snapshot_request():
@@ -544,14 +584,18 @@ class DomService:
 				params={'depth': -1, 'pierce': True}, session_id=cdp_session.session_id
 			)
 
-		start_cdp_calls = time.time()
+		start_cdp_calls = time.perf_counter()
 
 		# Create initial tasks
 		tasks = {
 			'snapshot': create_task_with_error_handling(create_snapshot_request(), name='get_snapshot'),
 			'dom_tree': create_task_with_error_handling(create_dom_tree_request(), name='get_dom_tree'),
-			'ax_tree': create_task_with_error_handling(self._get_ax_tree_for_all_frames(target_id), name='get_ax_tree'),
-			'device_pixel_ratio': create_task_with_error_handling(self._get_viewport_ratio(target_id), name='get_viewport_ratio'),
+			'ax_tree': create_task_with_error_handling(
+				self._get_ax_tree_for_all_frames(target_id, cdp_session), name='get_ax_tree'
+			),
+			'device_pixel_ratio': create_task_with_error_handling(
+				self._get_viewport_ratio(target_id, cdp_session), name='get_viewport_ratio'
+			),
 		}
 
 		# Wait for all tasks with timeout
@@ -567,10 +611,10 @@ class DomService:
 				tasks['snapshot']: lambda: create_task_with_error_handling(create_snapshot_request(), name='get_snapshot_retry'),
 				tasks['dom_tree']: lambda: create_task_with_error_handling(create_dom_tree_request(), name='get_dom_tree_retry'),
 				tasks['ax_tree']: lambda: create_task_with_error_handling(
-					self._get_ax_tree_for_all_frames(target_id), name='get_ax_tree_retry'
+					self._get_ax_tree_for_all_frames(target_id, cdp_session), name='get_ax_tree_retry'
 				),
 				tasks['device_pixel_ratio']: lambda: create_task_with_error_handling(
-					self._get_viewport_ratio(target_id), name='get_viewport_ratio_retry'
+					self._get_viewport_ratio(target_id, cdp_session), name='get_viewport_ratio_retry'
 				),
 			}
 
@@ -608,11 +652,11 @@ class DomService:
 		dom_tree = results['dom_tree']
 		ax_tree = results['ax_tree']
 		device_pixel_ratio = results['device_pixel_ratio']
-		end_cdp_calls = time.time()
+		end_cdp_calls = time.perf_counter()
 		cdp_calls_ms = (end_cdp_calls - start_cdp_calls) * 1000
 
 		# Calculate total time for _get_all_trees and overhead
-		start_snapshot_processing = time.time()
+		start_snapshot_processing = time.perf_counter()
 
 		# DEBUG: Log snapshot info and limit documents to prevent explosion
 		if snapshot and 'documents' in snapshot:
@@ -633,7 +677,7 @@ class DomService:
 						f'🔍 DEBUG: Iframe #{doc_idx} {doc.get("frameId", "no-frame-id")} {doc.get("url", "no-url")} has {len(doc.get("nodes", []))} nodes'
 					)
 
-		snapshot_processing_ms = (time.time() - start_snapshot_processing) * 1000
+		snapshot_processing_ms = (time.perf_counter() - start_snapshot_processing) * 1000
 
 		# Return with detailed timing breakdown
 		return TargetAllTrees(
@@ -672,12 +716,12 @@ class DomService:
 			Tuple of (enhanced_dom_tree_node, timing_info)
 		"""
 		timing_info: dict[str, float] = {}
-		timing_start_total = time.time()
+		timing_start_total = time.perf_counter()
 
 		# Get all trees from CDP (snapshot, DOM, AX, viewport ratio)
-		start_get_trees = time.time()
+		start_get_trees = time.perf_counter()
 		trees = await self._get_all_trees(target_id)
-		get_trees_ms = (time.time() - start_get_trees) * 1000
+		get_trees_ms = (time.perf_counter() - start_get_trees) * 1000
 		timing_info.update(trees.cdp_timing)
 		timing_info['get_all_trees_total_ms'] = get_trees_ms
 
@@ -688,25 +732,51 @@ class DomService:
 		js_click_listener_backend_ids = trees.js_click_listener_backend_ids or set()
 
 		# Build AX tree lookup
-		start_ax = time.time()
+		start_ax = time.perf_counter()
 		ax_tree_lookup: dict[int, AXNode] = {
 			ax_node['backendDOMNodeId']: ax_node for ax_node in ax_tree['nodes'] if 'backendDOMNodeId' in ax_node
 		}
-		timing_info['build_ax_lookup_ms'] = (time.time() - start_ax) * 1000
+		timing_info['build_ax_lookup_ms'] = (time.perf_counter() - start_ax) * 1000
 
 		enhanced_dom_tree_node_lookup: dict[int, EnhancedDOMTreeNode] = {}
 		""" NodeId (NOT backend node id) -> enhanced dom tree node"""  # way to get the parent/content node
 
 		# Parse snapshot data with everything calculated upfront
-		start_snapshot = time.time()
+		start_snapshot = time.perf_counter()
 		snapshot_lookup = build_snapshot_lookup(snapshot, device_pixel_ratio)
-		timing_info['build_snapshot_lookup_ms'] = (time.time() - start_snapshot) * 1000
+		timing_info['build_snapshot_lookup_ms'] = (time.perf_counter() - start_snapshot) * 1000
+
+		# Every node in this tree belongs to the same target, so resolve its session once instead of per node
+		try:
+			session = await self.browser_session.get_or_create_cdp_session(target_id, focus=False)
+			session_id = session.session_id
+		except ValueError:
+			# Target may have detached during DOM construction
+			session_id = None
+
+		# Checked once per tree so the per-node diagnostics below cost nothing when DEBUG logging is off
+		debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
+		# Set while constructing, lets us skip the hidden-iframe-elements pass entirely on pages without frames
+		has_frame_nodes = False
+
+		# Per-node callables/settings bound to locals once, so the recursion below does no attribute lookups on self for them
+		build_enhanced_ax_node = self._build_enhanced_ax_node
+		is_visible_according_to_all_parents = self.is_element_visible_according_to_all_parents
+		viewport_threshold = self.viewport_threshold
+		cross_origin_iframes = self.cross_origin_iframes
+
+		# Frame hierarchy and its src-URL index are fetched/built at most once per tree, the first time a
+		# cross-origin iframe needs them, and then shared by every other iframe in the tree
+		tree_all_frames = all_frames
+		frame_id_by_url: dict[str, str] | None = None
 
 		async def _construct_enhanced_node(
 			node: Node,
 			html_frames: list[EnhancedDOMTreeNode] | None,
 			total_frame_offset: DOMRect | None,
 			all_frames: dict | None,
+			parent: EnhancedDOMTreeNode | None = None,
 		) -> EnhancedDOMTreeNode:
 			"""
 			Recursively construct enhanced DOM tree nodes.
@@ -716,36 +786,42 @@ class DomService:
 				html_frames: List of HTML frame nodes encountered so far
 				total_frame_offset: Accumulated coordinate translation from parent iframes (includes scroll corrections)
 				all_frames: Pre-fetched frame hierarchy to avoid redundant CDP calls
+				parent: Already-constructed parent node, linked directly instead of being looked up by parentId
 			"""
+			nonlocal has_frame_nodes, tree_all_frames, frame_id_by_url
 
 			# Initialize lists if not provided
 			if html_frames is None:
 				html_frames = []
 
-			# to get rid of the pointer references
+			# The offset is shared with the parent and siblings and never mutated in place: the frame branches
+			# below rebind it to a new DOMRect, so only frame nodes pay for a copy instead of every node
 			if total_frame_offset is None:
 				total_frame_offset = DOMRect(x=0.0, y=0.0, width=0.0, height=0.0)
-			else:
-				total_frame_offset = DOMRect(
-					total_frame_offset.x, total_frame_offset.y, total_frame_offset.width, total_frame_offset.height
-				)
 
 			# memoize the mf (I don't know if some nodes are duplicated)
-			if node['nodeId'] in enhanced_dom_tree_node_lookup:
-				return enhanced_dom_tree_node_lookup[node['nodeId']]
+			node_id = node['nodeId']
+			existing_node = enhanced_dom_tree_node_lookup.get(node_id)
+			if existing_node is not None:
+				return existing_node
+
+			backend_node_id = node['backendNodeId']
+			node_name = sys.intern(node['nodeName'])
+			node_name_upper = _node_name_upper(node_name)
 
-			ax_node = ax_tree_lookup.get(node['backendNodeId'])
+			ax_node = ax_tree_lookup.get(backend_node_id)
 			if ax_node:
-				enhanced_ax_node = self._build_enhanced_ax_node(ax_node)
+				enhanced_ax_node = build_enhanced_ax_node(ax_node)
 			else:
 				enhanced_ax_node = None
 
 			# To make attributes more readable
 			attributes: dict[str, str] | None = None
-			if 'attributes' in node and node['attributes']:
-				attributes = {}
-				for i in range(0, len(node['attributes']), 2):
-					attributes[node['attributes'][i]] = node['attributes'][i + 1]
+			raw_attributes = node.get('attributes')
+			if raw_attributes:
+				# CDP returns a flat [name1, value1, name2, value2, ...] list, pair it up in C instead of a Python index loop
+				# and intern the names so the repeated 'class'/'id'/'href' keys across nodes share one string each
+				attributes = dict(zip(map(sys.intern, raw_attributes[::2]), raw_attributes[1::2]))
 
 			shadow_root_type = None
 			if 'shadowRootType' in node and node['shadowRootType']:
@@ -755,10 +831,10 @@ class DomService:
 					pass
 
 			# Get snapshot data and calculate absolute position
-			snapshot_data = snapshot_lookup.get(node['backendNodeId'], None)
+			snapshot_data = snapshot_lookup.get(backend_node_id, None)
 
 			# DIAGNOSTIC: Log when interactive elements don't have snapshot data
-			if not snapshot_data and node['nodeName'].upper() in ['INPUT', 'BUTTON', 'SELECT', 'TEXTAREA', 'A']:
+			if debug_enabled and not snapshot_data and node_name_upper in ['INPUT', 'BUTTON', 'SELECT', 'TEXTAREA', 'A']:
 				parent_has_shadow = False
 				parent_info = ''
 				if 'parentId' in node and node['parentId'] in enhanced_dom_tree_node_lookup:
@@ -767,9 +843,9 @@ class DomService:
 						parent_has_shadow = True
 						parent_info = f'parent={parent.tag_name}(shadow={parent.shadow_root_type})'
 				attr_str = ''
-				if 'attributes' in node and node['attributes']:
-					attrs_dict = {node['attributes'][i]: node['attributes'][i + 1] for i in range(0, len(node['attributes']), 2)}
-					attr_str = f'name={attrs_dict.get("name", "N/A")} id={attrs_dict.get("id", "N/A")}'
+				if attributes:
+					# reuse the dict parsed above instead of re-pairing the raw attribute list
+					attr_str = f'name={attributes.get("name", "N/A")} id={attributes.get("id", "N/A")}'
 				self.logger.debug(
 					f'🔍 NO SNAPSHOT DATA for <{node["nodeName"]}> backendNodeId={node["backendNodeId"]} '
 					f'{attr_str} {parent_info} (snapshot_lookup has {len(snapshot_lookup)} entries)'
@@ -784,20 +860,13 @@ class DomService:
 					height=snapshot_data.bounds.height,
 				)
 
-			try:
-				session = await self.browser_session.get_or_create_cdp_session(target_id, focus=False)
-				session_id = session.session_id
-			except ValueError:
-				# Target may have detached during DOM construction
-				session_id = None
-
 			dom_tree_node = EnhancedDOMTreeNode(
-				node_id=node['nodeId'],
-				backend_node_id=node['backendNodeId'],
-				node_type=NodeType(node['nodeType']),
-				node_name=node['nodeName'],
+				node_id=node_id,
+				backend_node_id=backend_node_id,
+				node_type=_NODE_TYPE_BY_VALUE[node['nodeType']],
+				node_name=node_name,
 				node_value=node['nodeValue'],
-				attributes=attributes or {},
+				attributes=attributes or _EMPTY_ATTRIBUTES,
 				is_scrollable=node.get('isScrollable', None),
 				frame_id=node.get('frameId', None),
 				session_id=session_id,
@@ -805,88 +874,94 @@ class DomService:
 				content_document=None,
 				shadow_root_type=shadow_root_type,
 				shadow_roots=None,
-				parent_node=None,
+				parent_node=parent,
 				children_nodes=None,
 				ax_node=enhanced_ax_node,
 				snapshot_node=snapshot_data,
 				is_visible=None,
-				has_js_click_listener=node['backendNodeId'] in js_click_listener_backend_ids,
+				has_js_click_listener=backend_node_id in js_click_listener_backend_ids,
 				absolute_position=absolute_position,
 			)
 
-			enhanced_dom_tree_node_lookup[node['nodeId']] = dom_tree_node
-
-			if 'parentId' in node and node['parentId']:
-				dom_tree_node.parent_node = enhanced_dom_tree_node_lookup[
-					node['parentId']
-				]  # parents should always be in the lookup
+			enhanced_dom_tree_node_lookup[node_id] = dom_tree_node
 
 			# Check if this is an HTML frame node and add it to the list
-			updated_html_frames = html_frames.copy()
-			if node['nodeType'] == NodeType.ELEMENT_NODE.value and node['nodeName'] == 'HTML' and node.get('frameId') is not None:
-				updated_html_frames.append(dom_tree_node)
+			# html_frames is never mutated, so most nodes share their parent's list and only frame nodes get a new one
+			updated_html_frames = html_frames
+			if node['nodeType'] == _ELEMENT_NODE_TYPE and node['nodeName'] == 'HTML' and node.get('frameId') is not None:
+				updated_html_frames = [*html_frames, dom_tree_node]
 
 				# and adjust the total frame offset by scroll
 				if snapshot_data and snapshot_data.scrollRects:
-					total_frame_offset.x -= snapshot_data.scrollRects.x
-					total_frame_offset.y -= snapshot_data.scrollRects.y
-					# DEBUG: Log iframe scroll information
-					self.logger.debug(
-						f'🔍 DEBUG: HTML frame scroll - scrollY={snapshot_data.scrollRects.y}, scrollX={snapshot_data.scrollRects.x}, frameId={node.get("frameId")}, nodeId={node["nodeId"]}'
+					total_frame_offset = DOMRect(
+						x=total_frame_offset.x - snapshot_data.scrollRects.x,
+						y=total_frame_offset.y - snapshot_data.scrollRects.y,
+						width=total_frame_offset.width,
+						height=total_frame_offset.height,
 					)
+					# DEBUG: Log iframe scroll information
+					if debug_enabled:
+						self.logger.debug(
+							f'🔍 DEBUG: HTML frame scroll - scrollY={snapshot_data.scrollRects.y}, scrollX={snapshot_data.scrollRects.x}, frameId={node.get("frameId")}, nodeId={node["nodeId"]}'
+						)
+
+			if node_name_upper == 'IFRAME' or node_name_upper == 'FRAME':
+				has_frame_nodes = True
 
 			# Calculate new iframe offset for content documents, accounting for iframe scroll
-			if (
-				(node['nodeName'].upper() == 'IFRAME' or node['nodeName'].upper() == 'FRAME')
-				and snapshot_data
-				and snapshot_data.bounds
-			):
+			if (node_name_upper == 'IFRAME' or node_name_upper == 'FRAME') and snapshot_data and snapshot_data.bounds:
 				if snapshot_data.bounds:
-					updated_html_frames.append(dom_tree_node)
+					updated_html_frames = [*html_frames, dom_tree_node]
 
-					total_frame_offset.x += snapshot_data.bounds.x
-					total_frame_offset.y += snapshot_data.bounds.y
+					total_frame_offset = DOMRect(
+						x=total_frame_offset.x + snapshot_data.bounds.x,
+						y=total_frame_offset.y + snapshot_data.bounds.y,
+						width=total_frame_offset.width,
+						height=total_frame_offset.height,
+					)
 
-			if 'contentDocument' in node and node['contentDocument']:
+			content_document = node.get('contentDocument')
+			if content_document:
+				# the content document's parent is forcefully set to the iframe node (helps traverse the tree)
 				dom_tree_node.content_document = await _construct_enhanced_node(
-					node['contentDocument'], updated_html_frames, total_frame_offset, all_frames
+					content_document, updated_html_frames, total_frame_offset, all_frames, dom_tree_node
 				)
-				dom_tree_node.content_document.parent_node = dom_tree_node
-				# forcefully set the parent node to the content document node (helps traverse the tree)
 
-			if 'shadowRoots' in node and node['shadowRoots']:
+			shadow_roots = node.get('shadowRoots')
+			if shadow_roots:
 				dom_tree_node.shadow_roots = []
-				for shadow_root in node['shadowRoots']:
+				for shadow_root in shadow_roots:
+					# the shadow root's parent is forcefully set to its host node (helps traverse the tree)
 					shadow_root_node = await _construct_enhanced_node(
-						shadow_root, updated_html_frames, total_frame_offset, all_frames
+						shadow_root, updated_html_frames, total_frame_offset, all_frames, dom_tree_node
 					)
-					# forcefully set the parent node to the shadow root node (helps traverse the tree)
-					shadow_root_node.parent_node = dom_tree_node
 					dom_tree_node.shadow_roots.append(shadow_root_node)
 
-			if 'children' in node and node['children']:
-				dom_tree_node.children_nodes = []
-				# Build set of shadow root node IDs to filter them out from children
-				shadow_root_node_ids = set()
-				if 'shadowRoots' in node and node['shadowRoots']:
-					for shadow_root in node['shadowRoots']:
-						shadow_root_node_ids.add(shadow_root['nodeId'])
+			children = node.get('children')
+			if children:
+				children_nodes: list[EnhancedDOMTreeNode] = []
+				dom_tree_node.children_nodes = children_nodes
+				append_child = children_nodes.append
+				# Build set of shadow root node IDs to filter them out from children (only hosts have any)
+				shadow_root_node_ids = {shadow_root['nodeId'] for shadow_root in shadow_roots} if shadow_roots else None
 
-				for child in node['children']:
+				for child in children:
 					# Skip shadow roots - they should only be in shadow_roots list
-					if child['nodeId'] in shadow_root_node_ids:
+					if shadow_root_node_ids and child['nodeId'] in shadow_root_node_ids:
 						continue
-					dom_tree_node.children_nodes.append(
-						await _construct_enhanced_node(child, updated_html_frames, total_frame_offset, all_frames)
+					append_child(
+						await _construct_enhanced_node(child, updated_html_frames, total_frame_offset, all_frames, dom_tree_node)
 					)
 
 			# Set visibility using the collected HTML frames and viewport threshold
-			dom_tree_node.is_visible = self.is_element_visible_according_to_all_parents(
-				dom_tree_node, updated_html_frames, self.viewport_threshold
-			)
+			dom_tree_node.is_visible = is_visible_according_to_all_parents(dom_tree_node, updated_html_frames, viewport_threshold)
 
 			# DEBUG: Log visibility info for form elements in iframes
-			if dom_tree_node.tag_name and dom_tree_node.tag_name.upper() in ['INPUT', 'SELECT', 'TEXTAREA', 'LABEL']:
+			if (
+				debug_enabled
+				and dom_tree_node.tag_name
+				and dom_tree_node.tag_name.upper() in ['INPUT', 'SELECT', 'TEXTAREA', 'LABEL']
+			):
 				attrs = dom_tree_node.attributes or {}
 				elem_id = attrs.get('id', '')
 				elem_name = attrs.get('name', '')
@@ -907,7 +982,7 @@ class DomService:
 
 			if (
 				# TODO: hacky way to disable cross origin iframes for now
-				self.cross_origin_iframes and node['nodeName'].upper() == 'IFRAME' and node.get('contentDocument', None) is None
+				cross_origin_iframes and node_name_upper == 'IFRAME' and node.get('contentDocument', None) is None
 			):  # None meaning there is no content
 				# Check iframe depth to prevent infinite recursion
 				if iframe_depth >= self.max_iframe_depth:
@@ -942,7 +1017,9 @@ class DomService:
 					if should_process_iframe:
 						# Lazy fetch all_frames only when actually needed (for cross-origin iframes)
 						if all_frames is None:
-							all_frames, _ = await self.browser_session.get_all_frames()
+							if tree_all_frames is None:
+								tree_all_frames, _ = await self.browser_session.get_all_frames()
+							all_frames = tree_all_frames
 
 						# Use pre-fetched all_frames to find the iframe's target (no redundant CDP call)
 						frame_id = node.get('frameId', None)
@@ -954,18 +1031,24 @@ class DomService:
 						if (not frame_id or frame_id not in all_frames) and attributes:
 							src = attributes.get('src', '')
 							if src:
-								src_base = src.split('?')[0].rstrip('/')
-								for fid, finfo in all_frames.items():
-									frame_url = finfo.get('url', '').split('?')[0].rstrip('/')
-									if frame_url and frame_url == src_base:
-										frame_id = fid
-										self.logger.debug(f'Matched cross-origin iframe by src URL: {src!r} -> frameId={fid}')
-										break
+								if frame_id_by_url is None:
+									# First frame wins for duplicate URLs, same as the linear scan this replaces
+									frame_id_by_url = {}
+									for fid, finfo in all_frames.items():
+										frame_url = finfo.get('url', '').split('?')[0].rstrip('/')
+										if frame_url:
+											frame_id_by_url.setdefault(frame_url, fid)
+								matched_frame_id = frame_id_by_url.get(src.split('?')[0].rstrip('/'))
+								if matched_frame_id:
+									frame_id = matched_frame_id
+									self.logger.debug(f'Matched cross-origin iframe by src URL: {src!r} -> frameId={frame_id}')
 
 						iframe_document_target = None
 						if frame_id:
 							frame_info = all_frames.get(frame_id)
-							if frame_info and frame_info.get('frameTargetId'):
+							# A frame hosted by the target we are already walking is not an OOPIF (e.g. a same-process
+							# frame whose document wasn't pierced yet); descending would just re-fetch this whole tree
+							if frame_info and frame_info.get('frameTargetId') and frame_info['frameTargetId'] != target_id:
 								iframe_target_id = frame_info['frameTargetId']
 								# Use frameTargetId directly from all_frames — get_all_frames() already
 								# validated connectivity. Do NOT gate on session_manager.get_target():
@@ -1003,17 +1086,18 @@ class DomService:
 		# Build enhanced DOM tree recursively
 		# Note: all_frames stays None and will be lazily fetched inside _construct_enhanced_node
 		# only if/when a cross-origin iframe is encountered
-		start_construct = time.time()
+		start_construct = time.perf_counter()
 		enhanced_dom_tree_node = await _construct_enhanced_node(
 			dom_tree['root'], initial_html_frames, initial_total_frame_offset, all_frames
 		)
-		timing_info['construct_enhanced_tree_ms'] = (time.time() - start_construct) * 1000
+		timing_info['construct_enhanced_tree_ms'] = (time.perf_counter() - start_construct) * 1000
 
-		# Count hidden elements per iframe for LLM hints
-		self._count_hidden_elements_in_iframes(enhanced_dom_tree_node)
+		# Count hidden elements per iframe for LLM hints (nothing to do if the tree has no iframe/frame elements)
+		if has_frame_nodes:
+			self._count_hidden_elements_in_iframes(enhanced_dom_tree_node)
 
 		# Calculate total time for get_dom_tree
-		total_get_dom_tree_ms = (time.time() - timing_start_total) * 1000
+		total_get_dom_tree_ms = (time.perf_counter() - timing_start_total) * 1000
 		timing_info['get_dom_tree_total_ms'] = total_get_dom_tree_ms
 
 		# Calculate overhead in get_dom_tree (time not accounted for by sub-operations)
@@ -1039,7 +1123,7 @@ class DomService:
 			Tuple of (serialized_dom_state, enhanced_dom_tree_root, timing_info)
 		"""
 		timing_info: dict[str, float] = {}
-		start_total = time.time()
+		start_total = time.perf_counter()
 
 		# Use current target (None means use current)
 		assert self.browser_session.agent_focus_target_id is not None
@@ -1057,12 +1141,12 @@ class DomService:
 		timing_info.update(dom_tree_timing)
 
 		# Serialize DOM tree for LLM
-		start_serialize = time.time()
+		start_serialize = time.perf_counter()
 
 		serialized_dom_state, serializer_timing = DOMTreeSerializer(
 			enhanced_dom_tree, previous_cached_state, paint_order_filtering=self.paint_order_filtering, session_id=session_id
 		).serialize_accessible_elements()
-		total_serialization_ms = (time.time() - start_serialize) * 1000
+		total_serialization_ms = (time.perf_counter() - start_serialize) * 1000
 
 		# Add serializer sub-timings (convert to ms)
 		for key, value in serializer_timing.items():
@@ -1075,7 +1159,7 @@ class DomService:
 			timing_info['serialization_overhead_ms'] = serialization_overhead_ms
 
 		# Calculate total time for get_serialized_dom_tree
-		total_get_serialized_dom_tree_ms = (time.time() - start_total) * 1000
+		total_get_serialized_dom_tree_ms = (time.perf_counter() - start_total) * 1000
 		timing_info['get_serialized_dom_tree_total_ms'] = total_get_serialized_dom_tree_ms
 
 		# Calculate overhead in get_serialized_dom_tree (time not accounted for)
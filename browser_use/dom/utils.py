@@ -1,3 +1,6 @@
+import re
+
+
 def cap_text_length(text: str, max_length: int) -> str:
 	"""Cap text length for display."""
 	if len(text) <= max_length:
@@ -5,53 +8,19 @@ def cap_text_length(text: str, max_length: int) -> str:
 	return text[:max_length] + '...'
 
 
-def generate_css_selector_for_element(enhanced_node) -> str | None:
-	"""Generate a CSS selector using node properties from version 0.5.0 approach."""
-	import re
-
-	if not enhanced_node or not hasattr(enhanced_node, 'tag_name') or not enhanced_node.tag_name:
-		return None
-
-	# Get base selector from tag name (simplified since we don't have xpath in EnhancedDOMTreeNode)
-	tag_name = enhanced_node.tag_name.lower().strip()
-	if not tag_name or not re.match(r'^[a-zA-Z][a-zA-Z0-9-]*$', tag_name):
-		return None
-
-	css_selector = tag_name
-
-	# Add ID if available (most specific)
-	if enhanced_node.attributes and 'id' in enhanced_node.attributes:
-		element_id = enhanced_node.attributes['id']
-		if element_id and element_id.strip():
-			element_id = element_id.strip()
-			# Validate ID contains only valid characters for # selector
-			if re.match(r'^[a-zA-Z][a-zA-Z0-9_-]*$', element_id):
-				return f'#{element_id}'
-			else:
-				# For IDs with special characters ($, ., :, etc.), use attribute selector
-				# Escape quotes in the ID value
-				escaped_id = element_id.replace('"', '\\"')
-				return f'{tag_name}[id="{escaped_id}"]'
-
-	# Handle class attributes (from version 0.5.0 approach)
-	if enhanced_node.attributes and 'class' in enhanced_node.attributes and enhanced_node.attributes['class']:
-		# Define a regex pattern for valid class names in CSS
-		valid_class_name_pattern = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_-]*$')
-
-		# Iterate through the class attribute values
-		classes = enhanced_node.attributes['class'].split()
-		for class_name in classes:
-			# Skip empty class names
-			if not class_name.strip():
-				continue
+# Compiled/built once at import instead of on every call
+_VALID_TAG_NAME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9-]*$')
+_VALID_ID_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_-]*$')
+_VALID_CLASS_NAME_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_-]*$')
+_WHITESPACE_RE = re.compile(r'\s+')
 
-			# Check if the class name is valid
-			if valid_class_name_pattern.match(class_name):
-				# Append the valid class name to the CSS selector
-				css_selector += f'.{class_name}'
+# Values containing any of these are matched with a contains selector on their first line
+_SPECIAL_VALUE_CHARS = frozenset('"\'<>`\n\r\t')
+_SELECTOR_CONTROL_CHARS = frozenset('\n\r\t')
 
-	# Expanded set of safe attributes that are stable and useful for selection (from v0.5.0)
-	SAFE_ATTRIBUTES = {
+# Attributes that are stable and useful for selection (from v0.5.0), including the dynamic data-* test hooks
+_SAFE_ATTRIBUTES = frozenset(
+	{
 		# Data attributes (if they're stable in your application)
 		'id',
 		# Standard HTML attributes
@@ -75,30 +44,55 @@ def generate_css_selector_for_element(enhanced_node) -> str | None:
 		# Custom stable attributes (add any application-specific ones)
 		'href',
 		'target',
+		# Dynamic attributes (include_dynamic_attributes=True equivalent)
+		'data-id',
+		'data-qa',
+		'data-cy',
+		'data-testid',
 	}
+)
 
-	# Always include dynamic attributes (include_dynamic_attributes=True equivalent)
-	include_dynamic_attributes = True
-	if include_dynamic_attributes:
-		dynamic_attributes = {
-			'data-id',
-			'data-qa',
-			'data-cy',
-			'data-testid',
-		}
-		SAFE_ATTRIBUTES.update(dynamic_attributes)
 
-	# Handle other attributes (from version 0.5.0 approach)
-	if enhanced_node.attributes:
-		for attribute, value in enhanced_node.attributes.items():
-			if attribute == 'class':
-				continue
+def generate_css_selector_for_element(enhanced_node) -> str | None:
+	"""Generate a CSS selector using node properties from version 0.5.0 approach."""
+	if not enhanced_node or not hasattr(enhanced_node, 'tag_name') or not enhanced_node.tag_name:
+		return None
 
-			# Skip invalid attribute names
-			if not attribute.strip():
-				continue
+	# Get base selector from tag name (simplified since we don't have xpath in EnhancedDOMTreeNode)
+	tag_name = enhanced_node.tag_name.lower().strip()
+	if not tag_name or not _VALID_TAG_NAME_RE.match(tag_name):
+		return None
 
-			if attribute not in SAFE_ATTRIBUTES:
+	css_selector = tag_name
+	attributes = enhanced_node.attributes
+
+	# Add ID if available (most specific)
+	if attributes and 'id' in attributes:
+		element_id = attributes['id']
+		if element_id and element_id.strip():
+			element_id = element_id.strip()
+			# Validate ID contains only valid characters for # selector
+			if _VALID_ID_RE.match(element_id):
+				return f'#{element_id}'
+			else:
+				# For IDs with special characters ($, ., :, etc.), use attribute selector
+				# Escape quotes in the ID value
+				escaped_id = element_id.replace('"', '\\"')
+				return f'{tag_name}[id="{escaped_id}"]'
+
+	# Handle class attributes (from version 0.5.0 approach)
+	class_value = attributes.get('class') if attributes else None
+	if class_value:
+		# Append every valid class name to the CSS selector (split() never yields empty names)
+		for class_name in class_value.split():
+			if _VALID_CLASS_NAME_RE.match(class_name):
+				css_selector += f'.{class_name}'
+
+	# Handle other attributes (from version 0.5.0 approach)
+	if attributes:
+		for attribute, value in attributes.items():
+			# 'class' and blank names are never in the safe set
+			if attribute not in _SAFE_ATTRIBUTES:
 				continue
 
 			# Escape special characters in attribute names
@@ -107,13 +101,13 @@ def generate_css_selector_for_element(enhanced_node) -> str | None:
 			# Handle different value cases
 			if value == '':
 				css_selector += f'[{safe_attribute}]'
-			elif any(char in value for char in '"\'<>`\n\r\t'):
+			elif not _SPECIAL_VALUE_CHARS.isdisjoint(value):
 				# Use contains for values with special characters
 				# For newline-containing text, only use the part before the newline
 				if '\n' in value:
 					value = value.split('\n')[0]
 				# Regex-substitute *any* whitespace with a single space, then strip.
-				collapsed_value = re.sub(r'\s+', ' ', value).strip()
+				collapsed_value = _WHITESPACE_RE.sub(' ', value).strip()
 				# Escape embedded double-quotes.
 				safe_value = collapsed_value.replace('"', '\\"')
 				css_selector += f'[{safe_attribute}*="{safe_value}"]'
@@ -122,7 +116,7 @@ def generate_css_selector_for_element(enhanced_node) -> str | None:
 
 	# Final validation: ensure the selector is safe and doesn't contain problematic characters
 	# Note: quotes are allowed in attribute selectors like [name="value"]
-	if css_selector and not any(char in css_selector for char in ['\n', '\r', '\t']):
+	if css_selector and _SELECTOR_CONTROL_CHARS.isdisjoint(css_selector):
 		return css_selector
 
 	# If we get here, the selector was problematic, return just the tag name as fallback
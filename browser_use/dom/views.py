@@ -1,4 +1,5 @@
 import hashlib
+import sys
 from dataclasses import asdict, dataclass, field
 from enum import Enum
 from typing import Any
@@ -161,6 +162,10 @@ DYNAMIC_CLASS_PATTERNS = frozenset(
 	}
 )
 
+# node_name -> interned lower-cased tag name, so the hot tag_name property returns a shared string
+# instead of allocating a new .lower() copy on every access
+_TAG_NAME_BY_NODE_NAME: dict[str, str] = {}
+
 
 class MatchLevel(Enum):
 	"""Element matching strictness levels for history replay."""
@@ -369,7 +374,7 @@ class EnhancedSnapshotNode:
 # 	element_index: int | None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, eq=False)
 class EnhancedDOMTreeNode:
 	"""
 	Enhanced DOM tree node that contains information from AX, DOM, and Snapshot trees. It's mostly based on the types on DOM node type with enhanced data from AX and Snapshot trees.
@@ -461,7 +466,18 @@ class EnhancedDOMTreeNode:
 	Whether this iframe has hidden non-interactive content below the viewport threshold.
 	"""
 
-	uuid: str = field(default_factory=uuid7str)
+	_uuid: str | None = None
+	"""Backing slot for `uuid`, generated on first access instead of for every node in every DOM refresh."""
+
+	@property
+	def uuid(self) -> str:
+		if self._uuid is None:
+			self._uuid = uuid7str()
+		return self._uuid
+
+	@uuid.setter
+	def uuid(self, value: str) -> None:
+		self._uuid = value
 
 	@property
 	def parent(self) -> 'EnhancedDOMTreeNode | None':
@@ -484,7 +500,10 @@ class EnhancedDOMTreeNode:
 
 	@property
 	def tag_name(self) -> str:
-		return self.node_name.lower()
+		tag_name = _TAG_NAME_BY_NODE_NAME.get(self.node_name)
+		if tag_name is None:
+			tag_name = _TAG_NAME_BY_NODE_NAME[self.node_name] = sys.intern(self.node_name.lower())
+		return tag_name
 
 	@property
 	def xpath(self) -> str:
@@ -898,16 +917,17 @@ class EnhancedDOMTreeNode:
 
 	def _get_parent_branch_path(self) -> list[str]:
 		"""Get the parent branch path as a list of tag names from root to current element."""
-		parents: list['EnhancedDOMTreeNode'] = []
+		# Collect tag names directly while walking up, instead of collecting nodes and mapping them afterwards
+		tag_names: list[str] = []
 		current_element: 'EnhancedDOMTreeNode | None' = self
 
 		while current_element is not None:
 			if current_element.node_type == NodeType.ELEMENT_NODE:
-				parents.append(current_element)
+				tag_names.append(current_element.tag_name)
 			current_element = current_element.parent_node
 
-		parents.reverse()
-		return [parent.tag_name for parent in parents]
+		tag_names.reverse()
+		return tag_names
 
 
 DOMSelectorMap = dict[int, EnhancedDOMTreeNode]
@@ -972,7 +992,7 @@ class SerializedDOMState:
 		return DOMEvalSerializer.serialize_tree(self._root, include_attributes)
 
 
-@dataclass
+@dataclass(slots=True)
 class DOMInteractedElement:
 	"""
 	DOMInteractedElement is a class that represents a DOM element that has been interacted with.
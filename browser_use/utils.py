@@ -13,7 +13,6 @@ from sys import stderr
 from typing import Any, ParamSpec, TypeVar
 from urllib.parse import urlparse
 
-import httpx
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -457,6 +456,11 @@ def is_unsafe_pattern(pattern: str) -> bool:
 	return '*' in bare_domain
 
 
+_NEW_TAB_PAGE_URLS = frozenset(
+	{'about:blank', 'chrome://new-tab-page/', 'chrome://new-tab-page', 'chrome://newtab/', 'chrome://newtab'}
+)
+
+
 def is_new_tab_page(url: str) -> bool:
 	"""
 	Check if a URL is a new tab page (about:blank, chrome://new-tab-page, or chrome://newtab).
@@ -467,7 +471,7 @@ def is_new_tab_page(url: str) -> bool:
 	Returns:
 		bool: True if the URL is a new tab page, False otherwise
 	"""
-	return url in ('about:blank', 'chrome://new-tab-page/', 'chrome://new-tab-page', 'chrome://newtab/', 'chrome://newtab')
+	return url in _NEW_TAB_PAGE_URLS
 
 
 def match_url_with_domain_pattern(url: str, domain_pattern: str, log_warnings: bool = False) -> bool:
@@ -623,6 +627,10 @@ async def check_latest_browser_use_version() -> str | None:
 	Returns:
 		The latest version string if successful, None if failed
 	"""
+	# Imported here: httpx is only needed for this one-off PyPI check, and importing it at module level made
+	# every `import browser_use` (utils is imported by nearly every module) pay for it up front
+	import httpx
+
 	try:
 		async with httpx.AsyncClient(timeout=3.0) as client:
 			response = await client.get('https://pypi.org/pypi/browser-use/json')
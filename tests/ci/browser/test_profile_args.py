@@ -0,0 +1,28 @@
+"""Test that BrowserProfile.get_args() emits launch args in a stable, declared order."""
+
+import tempfile
+
+from browser_use.browser.profile import CHROME_DEFAULT_ARGS, BrowserProfile
+
+
+def _make_profile(**kwargs) -> BrowserProfile:
+	return BrowserProfile(
+		user_data_dir=tempfile.mkdtemp(prefix='test-profile-args-'),
+		enable_default_extensions=False,
+		**kwargs,
+	)
+
+
+class TestBrowserProfileArgsOrder:
+	"""get_args() must not depend on set/hash ordering."""
+
+	def test_default_args_keep_declared_order(self):
+		"""Defaults left after ignore_default_args filtering are emitted in CHROME_DEFAULT_ARGS order."""
+		ignored = ['--disable-sync', '--no-first-run']
+		args = _make_profile(ignore_default_args=ignored).get_args()
+
+		expected = [arg for arg in CHROME_DEFAULT_ARGS if arg not in ignored and not arg.startswith('--disable-features=')]
+		emitted = [arg for arg in args if arg in expected]
+
+		assert emitted == expected
+		assert not set(ignored) & set(args)